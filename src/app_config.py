@@ -63,6 +63,20 @@ def get_default_config(legacy_overlay: Mapping[str, Any] | None = None) -> dict:
     }
 
 
+def copy_config(value: Any) -> Any:
+    """Deep-copy JSON-shaped config data.
+
+    Only dicts and lists are copied; every other leaf is an immutable JSON
+    scalar and is shared. Much cheaper than copy.deepcopy for this payload.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: copy_config(item) for key, item in value.items()}
+    if value_type is list:
+        return [copy_config(item) for item in value]
+    return value
+
+
 def filter_session_config(config: Mapping[str, Any]) -> dict:
     return {key: value for key, value in config.items() if key not in SHARED_CONFIG_KEYS}
 
@@ -103,6 +117,8 @@ class ConfigStore:
     def __init__(self, path: str | Path | None = None, legacy_dir: str | Path | None = None):
         self._path = Path(path) if path is not None else self.default_path()
         self.legacy_dir = Path(legacy_dir) if legacy_dir is not None else Path.cwd()
+        # Text of the last successful write; saves triggered by unrelated events are skipped
+        self._last_serialized = None
 
     @property
     def path(self) -> Path:
@@ -126,13 +142,25 @@ class ConfigStore:
     def save(self, config: dict) -> None:
         to_save = copy.deepcopy(config)
         remove_shared_keys_from_sessions(to_save)
+        # sort_keys so dict ordering changes alone never force a rewrite
+        serialized = json.dumps(to_save, indent=2, sort_keys=True)
+        if serialized == self._last_serialized:
+            return
 
+        # Write to a sibling file and swap it in so a crash never leaves a half-written config
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.path, 'w', encoding='utf-8') as config_file:
-                json.dump(to_save, config_file, indent=2)
+            with open(tmp_path, 'w', encoding='utf-8') as config_file:
+                config_file.write(serialized)
+            os.replace(tmp_path, self.path)
+            self._last_serialized = serialized
         except Exception as exc:
             logger.error("Error saving config to %s: %s", self.path, exc)
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
 
     def _load_candidates(self) -> list[Path]:
         candidates = [
@@ -3,7 +3,11 @@ import yaml
 import os
 import logging
 from functools import lru_cache
-from langdetect import detect, LangDetectException
+try:
+    # Optional: Google's compact language detector (native, faster on short text)
+    import gcld3
+except ImportError:
+    gcld3 = None
 from typing import Optional, List, Dict
 try:
     from src.utils.paths import get_resource_path
@@ -19,7 +23,82 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-LANGUAGE_CACHE_SIZE = 1024
+LANGUAGE_CACHE_SIZE = 2048
+SCRIPT_CACHE_SIZE = 4096
+# Prefer libyaml's C parser when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Script flags returned by LanguageDetector.script_flags()
+SCRIPT_HAN = 1
+SCRIPT_KANA = 2
+SCRIPT_HANGUL = 4
+SCRIPT_CJK = SCRIPT_HAN | SCRIPT_KANA
+_SCRIPT_ALL = SCRIPT_HAN | SCRIPT_KANA | SCRIPT_HANGUL
+_SCRIPT_RANGES = (
+    (SCRIPT_HAN, '\u4e00-\u9fff'),
+    (SCRIPT_KANA, '\u3040-\u30ff'),   # Hiragana + Katakana
+    (SCRIPT_HANGUL, '\uac00-\ud7af'),
+)
+
+_SCRIPT_MIN_CHAR = min(rng[0] for _, rng in _SCRIPT_RANGES)
+
+
+def _build_script_searches():
+    """
+    For every set of scripts not yet seen, one pattern with a group per script.
+    Once a script is found it drops out of the pattern, so the scan continues
+    from the last match and the text is walked at most once overall.
+    """
+    searches = {}
+    for missing in range(1, _SCRIPT_ALL + 1):
+        groups = [(flag, rng) for flag, rng in _SCRIPT_RANGES if missing & flag]
+        pattern = re.compile('|'.join(f'([{rng}])' for _, rng in groups))
+        searches[missing] = (pattern, tuple(flag for flag, _ in groups))
+    return searches
+
+
+_SCRIPT_SEARCHES = _build_script_searches()
+_ASCII_LETTER_RE = re.compile(r'[A-Za-z]')
+# cld3 still reports a few legacy ISO 639-1 codes; map them to langdetect's.
+_CLD3_CODE_MAP = {'iw': 'he', 'jw': 'jv', 'fil': 'tl'}
+
+
+@lru_cache(maxsize=None)
+def _langdetect_api():
+    """langdetect's detect and exception type, imported once on first use."""
+    from langdetect import detect as langdetect_detect, LangDetectException
+    return langdetect_detect, LangDetectException
+
+
+def detect(text: str) -> Optional[str]:
+    """
+    langdetect.detect, imported on first call to keep it off the startup path.
+    Returns None when langdetect finds no usable features in text.
+    """
+    langdetect_detect, LangDetectException = _langdetect_api()
+    try:
+        return langdetect_detect(text)
+    except LangDetectException:
+        return None
+
+
+def _scan_script_flags(text: str) -> int:
+    """Return the SCRIPT_* flags present in text in a single left-to-right pass."""
+    # Both checks run in C: isascii() is a flag lookup and max() a tight codepoint
+    # loop, so Latin/Cyrillic chat never reaches the regex scan.
+    if text.isascii() or max(text) < _SCRIPT_MIN_CHAR:
+        return 0
+    flags = 0
+    pos = 0
+    while flags != _SCRIPT_ALL:
+        pattern, group_flags = _SCRIPT_SEARCHES[_SCRIPT_ALL & ~flags]
+        match = pattern.search(text, pos)
+        if match is None:
+            break
+        flags |= group_flags[match.lastindex - 1]
+        pos = match.end()
+    return flags
+
 
 class LanguageDetector:
     """
@@ -27,13 +106,10 @@ class LanguageDetector:
     """
     
     def __init__(self):
-        # Regex for CJK characters (common ranges)
-        # Han, Hiragana, Katakana, etc.
-        self.cjk_pattern = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]')
-        # Specific scripts
-        self.hangul_pattern = re.compile(r'[\uac00-\ud7af]')
-        self.kana_pattern = re.compile(r'[\u3040-\u30ff]')
-        
+        self._cld3 = None
+        if gcld3 is not None:
+            self._cld3 = gcld3.NNetLanguageIdentifier(min_num_bytes=0, max_num_bytes=1000)
+
         # Load Ignore Patterns
         self.force_ignore_patterns = []
         self.internet_slang_patterns = []
@@ -45,6 +121,7 @@ class LanguageDetector:
         self._should_translate_cached = lru_cache(maxsize=LANGUAGE_CACHE_SIZE)(
             self._should_translate_uncached
         )
+        self._script_flags_cached = lru_cache(maxsize=SCRIPT_CACHE_SIZE)(_scan_script_flags)
 
     def _load_ignore_patterns(self):
         """Load ignore patterns from YAML."""
@@ -55,7 +132,7 @@ class LanguageDetector:
         if os.path.exists(path):
             try:
                 with open(path, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                    data = yaml.load(f, Loader=YAML_LOADER)
                     
                 if data:
                     self.force_ignore_patterns = data.get('force_ignore', [])
@@ -70,13 +147,19 @@ class LanguageDetector:
             self._load_hardcoded_patterns()
 
     def _compile_ignore_patterns(self):
-        """Compile ignore patterns once so every message does not recompile regexes."""
-        self._ignore_regexes = []
+        """Compile ignore patterns once into a single alternation so every message is scanned once."""
+        valid_patterns = []
         for pattern in self.force_ignore_patterns + self.internet_slang_patterns:
             try:
-                self._ignore_regexes.append(re.compile(pattern, re.IGNORECASE))
+                re.compile(pattern, re.IGNORECASE)
             except re.error as exc:
                 logger.error(f"Invalid ignore pattern {pattern!r}: {exc}")
+                continue
+            valid_patterns.append(f"(?:{pattern})")
+
+        self._ignore_re = None
+        if valid_patterns:
+            self._ignore_re = re.compile("|".join(valid_patterns), re.IGNORECASE)
 
     def _load_hardcoded_patterns(self):
         """Fallback patterns if YAML missing."""
@@ -91,13 +174,28 @@ class LanguageDetector:
             r'^omg+$', r'^afk$', r'^brb$', r'^o7+$', r'^gf+$', r'^gg+$'
         ]
 
+    def script_flags(self, text: str) -> int:
+        """Bitmask of SCRIPT_HAN / SCRIPT_KANA / SCRIPT_HANGUL present in text."""
+        return self._script_flags_cached(text)
+
     def is_cjk(self, text: str) -> bool:
-        """Fast check if text contains CJK characters."""
-        return bool(self.cjk_pattern.search(text))
+        """Fast check if text contains CJK characters (Han, Hiragana, Katakana)."""
+        return bool(self.script_flags(text) & SCRIPT_CJK)
 
     def detect_language(self, text: str) -> str:
         return self._detect_language_cached(text)
 
+    def detect_languages_batch(self, texts: List[str]) -> List[str]:
+        """
+        Detect languages for a batch of lines (e.g. a history backfill).
+        Each distinct text is classified once; repeats are served from the batch.
+        """
+        results: Dict[str, str] = {}
+        for text in texts:
+            if text not in results:
+                results[text] = self._detect_language_cached(text)
+        return [results[text] for text in texts]
+
     def _detect_language_uncached(self, text: str) -> str:
         """
         Identify language code (ISO 639-1).
@@ -112,31 +210,45 @@ class LanguageDetector:
         if len(text) < 4 and text.isascii():
             return 'en'
 
-        detected = 'unknown'
-        try:
-            detected = detect(text)
-        except LangDetectException:
+        # ASCII without any letters (numbers, "+1", "12:30 !!") gives langdetect
+        # no features and falls back to 'en' below; skip the model entirely.
+        if text.isascii() and not _ASCII_LETTER_RE.search(text):
+            return 'en'
+
+        detected = self._detect_statistical(text)
+        if detected is None:
             # Fallback: If pure ASCII, assume English
             if text.isascii():
                 return 'en'
-            pass
+            detected = 'unknown'
             
         # Refine CJK detection
-        if self.is_cjk(text):
+        scripts = self.script_flags(text)
+        if scripts & SCRIPT_CJK:
             # 1. If detected as non-CJK ('sw', 'tr', 'en'), force 'zh'.
             if not detected.startswith('zh') and detected not in ['ja', 'ko']:
                 return 'zh'
             
             # 2. If detected as 'ko' (Korean) but NO Hangul -> Force 'zh'
-            if detected == 'ko' and not self.hangul_pattern.search(text):
+            if detected == 'ko' and not scripts & SCRIPT_HANGUL:
                 return 'zh'
                 
             # 3. If detected as 'ja' (Japanese) but NO Kana -> Force 'zh'
             # (Pure Kanji is usually Chinese in this context)
-            if detected == 'ja' and not self.kana_pattern.search(text):
+            if detected == 'ja' and not scripts & SCRIPT_KANA:
                 return 'zh'
 
         return detected
+
+    def _detect_statistical(self, text: str) -> Optional[str]:
+        """Use cld3 when installed and confident, otherwise langdetect."""
+        if self._cld3 is not None:
+            result = self._cld3.FindLanguage(text)
+            lang = result.language
+            # Romanized variants (e.g. 'zh-Latn') are not useful for routing.
+            if result.is_reliable and lang != 'und' and not lang.endswith('-Latn'):
+                return _CLD3_CODE_MAP.get(lang, lang)
+        return detect(text)
             
     def should_translate(self, text: str, target_lang: str = 'en', ignored_langs=None) -> (bool, str):
         if ignored_langs is None:
@@ -153,9 +265,8 @@ class LanguageDetector:
 
         # 1a. KEYWORD FILTER (Force Ignore)
         s_text = text.strip()
-        for pattern in self._ignore_regexes:
-            if pattern.search(s_text):
-                return False, 'ignored_keyword'
+        if self._ignore_re is not None and self._ignore_re.search(s_text):
+            return False, 'ignored_keyword'
 
         # 1. CJK fast check (ALWAYS translate CJK if target is not CJK)
         if self.is_cjk(text):
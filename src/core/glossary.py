@@ -1,8 +1,16 @@
 import os
+import re
 import yaml
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 try:
     from src.utils.paths import get_resource_path
 except ImportError:
@@ -16,6 +24,19 @@ except ImportError:
         return os.path.join(base_path, relative_path)
 
 logger = logging.getLogger(__name__)
+# Prefer libyaml's C parser when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed glossary files shared across EVEGlossary instances.
+# path -> (mtime_ns, size, flattened terms)
+YAML_CACHE_SIZE = 32
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, str]]]" = OrderedDict()
+
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+
+_ALNUM_TERM_RE = re.compile(r'^[a-zA-Z0-9]+$')
+
+REPLACE_CACHE_SIZE = 4096
 
 class EVEGlossary:
     """
@@ -30,7 +51,81 @@ class EVEGlossary:
         self.terms: Dict[str, str] = self._load_glossary()
         
         # Sort terms by length (descending) to ensure longest matches are replaced first.
-        self.sorted_terms = sorted(self.terms.items(), key=lambda x: len(x[0]), reverse=True)
+        # Replacements are looked up by key, so only the ordered keys are kept.
+        self._sorted_keys = sorted(self.terms, key=len, reverse=True)
+        self._repl_map = dict(self.terms)
+        # Every match starts with one of these; text without any of them is left alone.
+        self._trigger_chars = frozenset(term[0] for term in self._sorted_keys if term.strip())
+        self._literal_re, self._alnum_re = self._compile_term_patterns()
+        self._literal_automaton = self._build_literal_automaton()
+        # Fleet chat repeats the same calls constantly; terms are fixed per instance.
+        self._replace_terms_cached = lru_cache(maxsize=REPLACE_CACHE_SIZE)(
+            self._replace_terms_uncached
+        )
+
+    @property
+    def sorted_terms(self):
+        """(term, replacement) pairs, longest term first."""
+        return [(term, self._repl_map[term]) for term in self._sorted_keys]
+
+    def _compile_term_patterns(self) -> Tuple[Optional[re.Pattern], Optional[re.Pattern]]:
+        """
+        Build one alternation for CJK/symbol terms and one for alphanumeric terms,
+        so a message is scanned twice instead of once per term.
+        Alternatives keep the longest-first order so longer terms win at a position.
+        """
+        literal_terms = []
+        alnum_terms = []
+        for term in self._sorted_keys:
+            if not term.strip():
+                continue
+            if _ALNUM_TERM_RE.match(term):
+                alnum_terms.append(re.escape(term))
+            else:
+                literal_terms.append(re.escape(term))
+
+        # Literal replacement for CJK or symbols (like +1) where \b isn't applicable
+        literal_re = re.compile('|'.join(literal_terms)) if literal_terms else None
+        # Word boundaries for alphanumeric terms (prevents '00' matching inside '1600')
+        alnum_re = re.compile(r'\b(?:' + '|'.join(alnum_terms) + r')\b') if alnum_terms else None
+        return literal_re, alnum_re
+
+    def _build_literal_automaton(self):
+        """
+        Build an Aho-Corasick automaton over the CJK/symbol terms when pyahocorasick
+        is installed, so the literal pass costs O(len(text)) however large the glossary.
+        """
+        if ahocorasick is None or self._literal_re is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        repl_map = self._repl_map
+        for term in self._sorted_keys:
+            if term.strip() and not _ALNUM_TERM_RE.match(term):
+                automaton.add_word(term, (len(term), repl_map[term]))
+        automaton.make_automaton()
+        return automaton
+
+    def _replace_literals_automaton(self, text: str) -> str:
+        """
+        Splice automaton matches into text with the same semantics as the literal
+        alternation: leftmost match first, longest term at a position, no overlaps.
+        """
+        matches = sorted(
+            (end - length + 1, -length, replacement)
+            for end, (length, replacement) in self._literal_automaton.iter(text)
+        )
+        parts = []
+        pos = 0
+        for start, neg_length, replacement in matches:
+            if start < pos:
+                continue
+            parts.append(text[pos:start])
+            parts.append(f" {replacement} ")
+            pos = start - neg_length
+        if not parts:
+            return text
+        parts.append(text[pos:])
+        return "".join(parts)
         
     def _load_glossary(self) -> Dict[str, str]:
         """Load glossary from YAML files with fallback."""
@@ -65,35 +160,68 @@ class EVEGlossary:
         return terms
 
     def _load_yaml_glossary(self, filepath: str) -> Dict[str, str]:
-        """Load and flatten YAML glossary file."""
+        """Load and flatten YAML glossary file, reusing the parse if the file is unchanged."""
+        try:
+            st = os.stat(filepath)
+        except OSError as e:
+            logger.error(f"Error loading glossary {filepath}: {e}")
+            return {}
+
+        cached = _YAML_CACHE.get(filepath)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _YAML_CACHE.move_to_end(filepath)
+            return dict(cached[2])
+
+        flattened = self._parse_yaml_glossary(filepath)
+        if flattened is None:
+            return {}
+
+        _YAML_CACHE[filepath] = (st.st_mtime_ns, st.st_size, flattened)
+        _YAML_CACHE.move_to_end(filepath)
+        if len(_YAML_CACHE) > YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+        return dict(flattened)
+
+    def _parse_yaml_glossary(self, filepath: str) -> Optional[Dict[str, str]]:
+        """
+        Parse and flatten YAML glossary file. Returns None on error.
+        Walks the composed node tree instead of constructing nested dicts
+        and flattening them afterwards.
+        """
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            
-            if not data:
+                loader = YAML_LOADER(f)
+                try:
+                    root = loader.get_single_node()
+                finally:
+                    loader.dispose()
+
+            if root is None:
                 return {}
-                
+            if not isinstance(root, yaml.MappingNode):
+                raise ValueError("top level is not a mapping")
+
             # Flatten everything except 'meta' key
             flattened = {}
-            for key, value in data.items():
-                if key == 'meta': continue
-                if isinstance(value, dict):
-                    flattened.update(self._flatten_dict(value))
-            
+            for key_node, value_node in root.value:
+                if key_node.value == 'meta': continue
+                if isinstance(value_node, yaml.MappingNode):
+                    self._flatten_node(value_node, flattened)
+
             return flattened
         except Exception as e:
             logger.error(f"Error loading glossary {filepath}: {e}")
-            return {}
+            return None
 
-    def _flatten_dict(self, nested_dict: dict) -> Dict[str, str]:
-        """Recursively flatten nested dictionary."""
-        flattened = {}
-        for key, value in nested_dict.items():
-            if isinstance(value, dict):
-                flattened.update(self._flatten_dict(value))
-            elif isinstance(value, str):
-                flattened[key] = value
-        return flattened
+    def _flatten_node(self, node: yaml.MappingNode, flattened: Dict[str, str]):
+        """Recursively collect string leaves of a mapping node into flattened."""
+        for key_node, value_node in node.value:
+            if isinstance(value_node, yaml.MappingNode):
+                self._flatten_node(value_node, flattened)
+            elif (isinstance(key_node, yaml.ScalarNode)
+                  and isinstance(value_node, yaml.ScalarNode)
+                  and value_node.tag == _YAML_STR_TAG):
+                flattened[key_node.value] = value_node.value
 
     def replace_terms(self, text: str) -> str:
         """
@@ -101,33 +229,28 @@ class EVEGlossary:
         """
         if not text:
             return text
-            
+        if self._trigger_chars.isdisjoint(text):
+            return " ".join(text.split())
+        return self._replace_terms_cached(text)
+
+    def _replace_terms_uncached(self, text: str) -> str:
         processed = text
-        # Use simple iteration but with regex for safety on alphanumeric terms
-        import re
+        repl_map = self._repl_map
 
-        for term, replacement in self.sorted_terms:
-            if not term.strip():
-                continue
-            
-            # Use regex for alphanumeric terms (prevents '00' matching inside '1600')
-            # Check if term is basically "word characters"
-            if re.match(r'^[a-zA-Z0-9]+$', term):
-                # \b matches word boundary. 
-                # Note: We replaced `term` with `replacement` surrounded by spaces.
-                # However, if we blindly replace, we might re-replace things we just replaced?
-                # sorted_terms is by length descending, so 1600 replaced before 00.
-                # But '00' finds parts of '1600mm'.
-                # Boundary check solves this: \b00\b won't match inside 1600mm.
-                pattern = r'\b' + re.escape(term) + r'\b'
-                # Check if it matches before compiling replacement? regex sub handles it.
-                processed = re.sub(pattern, f" {replacement} ", processed)
-            else:
-                # Fallback to literal replacement for CJK or symbols (like +1) where \b isn't applicable
-                if term in processed:
-                    processed = processed.replace(term, f" {replacement} ")
+        def _replace(match):
+            return f" {repl_map[match.group(0)]} "
+
+        # CJK/symbol terms go first: the spaces they insert give adjacent
+        # alphanumeric terms (e.g. 'nb' in 'nb辛迪加') the word boundary they need.
+        if self._literal_automaton is not None:
+            processed = self._replace_literals_automaton(processed)
+        elif self._literal_re is not None:
+            processed = self._literal_re.sub(_replace, processed)
+        if self._alnum_re is not None:
+            processed = self._alnum_re.sub(_replace, processed)
                 
-        # Clean up double spaces introduced
+        # Clean up double spaces introduced.
+        # split()/join stays in C and beats re.sub(r'\s+', ' ', ...).strip() ~3x on chat-sized text.
         return " ".join(processed.split())
 
     def _get_hardcoded_fallback(self) -> Dict[str, str]:
@@ -3,6 +3,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Dict
 
+# Header detection (see LineParser.is_header_line)
+_SEPARATOR_RE = re.compile(r'^\s*-{20,}\s*$')
+_METADATA_RE = re.compile(r'(Channel ID|Channel Name|Listener|Session started):')
+
 @dataclass
 class ChatMessage:
     """Represents a parsed fleet chat message."""
@@ -44,7 +48,7 @@ class LineParser:
         
         # Parse timestamp
         try:
-            timestamp = datetime.strptime(ts_str, '%Y.%m.%d %H:%M:%S')
+            timestamp = self._parse_timestamp(ts_str)
         except ValueError:
             # Should not happen if regex matches, but safety first
             return None
@@ -61,13 +65,24 @@ class LineParser:
             is_system=is_system
         )
 
+    @staticmethod
+    def _parse_timestamp(ts_str: str) -> datetime:
+        """Parse 'YYYY.MM.DD HH:MM:SS'. Slicing avoids strptime's per-call format parsing."""
+        if len(ts_str) != 19:
+            # Regex allows extra whitespace between date and time
+            return datetime.strptime(ts_str, '%Y.%m.%d %H:%M:%S')
+        return datetime(
+            int(ts_str[0:4]), int(ts_str[5:7]), int(ts_str[8:10]),
+            int(ts_str[11:13]), int(ts_str[14:16]), int(ts_str[17:19])
+        )
+
     def is_header_line(self, line: str) -> bool:
         """Returns True if line is likely part of the header section."""
         # Separator line
-        if re.match(r'^\s*-{20,}\s*$', line):
+        if _SEPARATOR_RE.match(line):
             return True
         # Metadata lines
-        if re.search(r'(Channel ID|Channel Name|Listener|Session started):', line):
+        if _METADATA_RE.search(line):
             return True
         # Blank or mostly whitespace
         if not line.strip():
@@ -4,6 +4,7 @@ from pathlib import Path
 from PySide6.QtCore import QObject, QCoreApplication, QFileSystemWatcher, Qt, QTimer, Signal
 
 logger = logging.getLogger(__name__)
+# Bursts of writes inside this window are read and emitted as one lines_ready batch.
 LOG_WATCH_DEBOUNCE_MS = 100
 WATCHED_LOG_FALLBACK_SECONDS = 5.0
 
@@ -87,23 +88,7 @@ class ChatSession(QObject):
 
         # FIX: Don't just skip everything! Load last N messages for context.
         # This fixes the issue where a newly detected log shows nothing until a new message arrives.
-        history_lines = self.config.get('fleet_history_lines', 5)
-        
-        if history_lines > 0:
-            # CHECK: Is this log file stale?
-            # If the file hasn't been modified in > 30 minutes, don't show old history.
-            try:
-                mtime = self.log_path.stat().st_mtime
-                threshold = self.config.get('fleet_inactive_threshold', 1800)
-                if time.time() - mtime < threshold:
-                    last_lines = self.tailer.read_last_n_lines(history_lines)
-                    if last_lines:
-                        logger.info(f"[{self.session_id}] Loaded {len(last_lines)} existing messages")
-                        self.lines_ready.emit(self.session_id, last_lines)
-                else:
-                    logger.info(f"[{self.session_id}] Log is stale (>30m old). Skipping history backfill.")
-            except OSError:
-                pass
+        self._backfill_history("existing messages")
 
         self.tailer.seek_to_end()
 
@@ -176,22 +161,7 @@ class ChatSession(QObject):
             self.overlay.clear_messages()
 
         # Load last N lines from new log
-        history_lines = self.config.get('fleet_history_lines', 5)
-        if history_lines > 0:
-            # CHECK: Is this log file stale?
-            try:
-                mtime = self.log_path.stat().st_mtime
-                threshold = self.config.get('fleet_inactive_threshold', 1800)
-                if time.time() - mtime < threshold:
-                    last_lines = self.tailer.read_last_n_lines(history_lines)
-                    if last_lines:
-                        logger.info(f"[{self.session_id}] Loaded {len(last_lines)} messages from new fleet log")
-                        # Emit these lines for processing
-                        self.lines_ready.emit(self.session_id, last_lines)
-                else:
-                    logger.info(f"[{self.session_id}] Log is stale (>30m old). Skipping history backfill.")
-            except OSError:
-                pass
+        self._backfill_history("messages from new fleet log")
 
         # Seek to end for future messages
         self.tailer.seek_to_end()
@@ -202,6 +172,30 @@ class ChatSession(QObject):
 
         logger.info(f"[{self.session_id}] Fleet log switch complete")
 
+    def _backfill_history(self, description: str):
+        """Emit the last N messages of the log unless it has gone stale."""
+        history_lines = self.config.get('fleet_history_lines', 5)
+        if history_lines <= 0:
+            return
+
+        # CHECK: Is this log file stale?
+        # If the file hasn't been modified in > 30 minutes, don't show old history.
+        try:
+            mtime = self.log_path.stat().st_mtime
+        except OSError:
+            return
+
+        threshold = self.config.get('fleet_inactive_threshold', 1800)
+        if time.time() - mtime >= threshold:
+            logger.info(f"[{self.session_id}] Log is stale (>30m old). Skipping history backfill.")
+            return
+
+        last_lines = self.tailer.read_last_n_lines(history_lines)
+        if last_lines:
+            logger.info(f"[{self.session_id}] Loaded {len(last_lines)} {description}")
+            # Emit these lines for processing
+            self.lines_ready.emit(self.session_id, last_lines)
+
     def _configured_poll_interval_ms(self):
         interval = self.config.get('polling_interval', 1.0)
         return max(100, int(interval * 1000))
@@ -277,6 +271,13 @@ class ChatSession(QObject):
             self.overlay.add_message(text, sender, timestamp,
                                     original_text, is_translated)
 
+    def add_messages(self, messages: list):
+        """Add a batch of (text, sender, timestamp, original, is_translated) messages."""
+        if self.overlay:
+            for text, sender, timestamp, original_text, is_translated in messages:
+                self.overlay.add_message(text, sender, timestamp,
+                                        original_text, is_translated)
+
     def get_config(self) -> dict:
         """Get current overlay config (position, size, etc.)."""
         if self.overlay:
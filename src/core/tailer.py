@@ -3,6 +3,24 @@ import time
 from pathlib import Path
 from typing import List, Optional
 
+# Bytes read per step when scanning a log backwards for history
+TAIL_CHUNK_SIZE = 65536
+_UTF16_NEWLINE = '\n'.encode('utf-16-le')
+
+
+def _split_log_lines(text: str) -> List[str]:
+    """
+    Split on CRLF, CR and LF only (universal newlines), without the terminators.
+    str.splitlines() would also split on control characters used inside EVE links.
+    """
+    if not text:
+        return []
+    lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    if lines[-1] == '':
+        lines.pop()
+    return lines
+
+
 class FleetLogTailer:
     """
     Tails a fleet log file, reading new lines as they are written.
@@ -12,19 +30,17 @@ class FleetLogTailer:
         self.filepath = Path(filepath)
         self.file_handle = None
         self.last_position = 0
+        self._inode = None
         self._open()
 
     def _open(self):
         """Open file and seek to last position."""
-        if not self.filepath.exists():
-            # Wait or just set handle to None? 
-            # For now, let's assume caller ensures file exists or we handle it gracefully.
-            self.file_handle = None
-            return
-
+        # A missing file is reported by open() itself (FileNotFoundError), so no
+        # separate exists() check that could race with the client creating the log.
         try:
-            # EVE logs are UTF-16 LE
-            self.file_handle = open(self.filepath, 'r', encoding='utf-16-le', errors='replace')
+            # EVE logs are UTF-16 LE; bytes are read raw and decoded in bulk
+            self.file_handle = open(self.filepath, 'rb')
+            self._inode = os.fstat(self.file_handle.fileno()).st_ino
             # If opening for the first time, we might want to start at the end 
             # (only read NEW messages) or start at beginning. 
             # For this implementation, we rely on seek_to_end() being called explicitly if needed.
@@ -40,44 +56,55 @@ class FleetLogTailer:
             self.last_position = self.file_handle.tell()
         else:
             # If file not open, try to open and seek
-            if self.filepath.exists():
-                self._open()
-                if self.file_handle:
-                    self.file_handle.seek(0, os.SEEK_END)
-                    self.last_position = self.file_handle.tell()
+            self._open()
+            if self.file_handle:
+                self.file_handle.seek(0, os.SEEK_END)
+                self.last_position = self.file_handle.tell()
 
     def read_new_lines(self) -> List[str]:
         """Read new lines since last call."""
-        if not self.filepath.exists():
-            return []
-
         if self.file_handle is None:
             self._open()
             if self.file_handle is None:
                 return []
 
-        # Check if file was truncated or rotated (size became smaller)
+        # Size comes from fstat on the open handle (no path lookup). The path is
+        # only stat'ed when nothing new arrived, to notice truncation or the log
+        # being replaced by a different file.
         try:
-            current_size = self.filepath.stat().st_size
-            if current_size < self.last_position:
-                # File was truncated/rotated, reopen from start
-                self.file_handle.close()
-                self.last_position = 0
-                self._open()
+            current_size = os.fstat(self.file_handle.fileno()).st_size
+            if current_size <= self.last_position:
+                st = self.filepath.stat()
+                if current_size < self.last_position or st.st_ino != self._inode:
+                    # File was truncated/rotated, reopen from start
+                    self.file_handle.close()
+                    self.last_position = 0
+                    self._open()
+                    if self.file_handle is None:
+                        return []
+                    current_size = os.fstat(self.file_handle.fileno()).st_size
         except OSError:
             # File might have been locked or deleted momentarily
             return []
 
-        # Read new lines
+        # Read exactly the new byte range as whole UTF-16 code units; an odd
+        # trailing byte (write in progress) is picked up by the next poll.
+        length = (current_size - self.last_position) & ~1
+        if length <= 0:
+            return []
+
         try:
             self.file_handle.seek(self.last_position)
-            lines = self.file_handle.readlines()
-            self.last_position = self.file_handle.tell()
-            # rstrip to remove newline characters, but keep indentation if any
-            return [line.rstrip('\r\n') for line in lines]
-        except (UnicodeError, OSError):
-            # Encoding or IO error, potentially due to partial write
+            raw = self.file_handle.read(length)
+        except OSError:
+            # IO error, potentially due to partial write
             return []
+        # Likewise hold back a high surrogate whose low half is not written yet,
+        # instead of decoding it to U+FFFD.
+        if raw and 0xD8 <= raw[-1] <= 0xDB:
+            raw = raw[:-2]
+        self.last_position += len(raw)
+        return _split_log_lines(raw.decode('utf-16-le', errors='replace'))
 
     def close(self):
         if self.file_handle:
@@ -88,6 +115,15 @@ class FleetLogTailer:
     def _is_message_line(line: str) -> bool:
         return '[ 2' in line and '] ' in line
 
+    @staticmethod
+    def _first_newline_offset(buffer: bytes, position: int) -> int:
+        """Offset of the first UTF-16LE '\\n' in buffer that starts a code unit, or -1."""
+        idx = buffer.find(_UTF16_NEWLINE)
+        # Code units start at even file offsets; skip matches straddling two units
+        while idx >= 0 and (position + idx) % 2:
+            idx = buffer.find(_UTF16_NEWLINE, idx + 1)
+        return idx
+
     def _read_all_message_lines(self) -> List[str]:
         with open(self.filepath, 'r', encoding='utf-16-le', errors='replace') as f:
             return [
@@ -112,46 +148,50 @@ class FleetLogTailer:
         Returns:
             List of message lines (may be less than N if file is shorter)
         """
-        if not self.filepath.exists():
-            return []
-
         try:
             if n <= 0:
                 return self._read_all_message_lines()
 
-            file_size = self.filepath.stat().st_size
-            if file_size == 0:
-                return []
-
-            chunk_size = 8192
-            position = file_size
-            buffer = b''
-            message_lines = []
+            # Blocks are decoded once each; the partial line at the front of a block
+            # is carried (as bytes) into the next, earlier read.
+            blocks = []
+            found = 0
+            carry = b''
 
+            # A missing file surfaces as OSError from open(); the size comes from
+            # the open handle, so no separate exists()/stat() by path is needed.
             with open(self.filepath, 'rb') as f:
-                while position > 0 and len(message_lines) < n:
-                    read_size = min(chunk_size, position)
+                position = os.fstat(f.fileno()).st_size
+                while position > 0 and found < n:
+                    read_size = min(TAIL_CHUNK_SIZE, position)
                     if read_size % 2 and read_size < position:
                         read_size -= 1
                     position -= read_size
                     f.seek(position)
-                    buffer = f.read(read_size) + buffer
-
-                    text = buffer.decode('utf-16-le', errors='replace')
-                    lines = text.splitlines()
-                    if position > 0 and lines:
-                        lines = lines[1:]
-
-                    message_lines = [
+                    buffer = f.read(read_size) + carry
+
+                    cut = 0
+                    if position > 0:
+                        cut = self._first_newline_offset(buffer, position)
+                        if cut < 0:
+                            # No line break yet: the whole block is part of one line
+                            carry = buffer
+                            continue
+                    carry = buffer[:cut]
+
+                    lines = [
                         line.rstrip('\r\n')
-                        for line in lines
+                        for line in buffer[cut:].decode('utf-16-le', errors='replace').splitlines()
                         if self._is_message_line(line)
                     ]
+                    blocks.append(lines)
+                    found += len(lines)
 
+            message_lines = [line for lines in reversed(blocks) for line in lines]
             if len(message_lines) <= n:
                 return message_lines
             return message_lines[-n:]
 
         except (OSError, UnicodeError) as e:
-            # File read error
+            # File read error (or file missing)
             return []
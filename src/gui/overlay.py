@@ -16,6 +16,39 @@ from src.version import __version__
 
 MAX_VISIBLE_MESSAGES = 100
 UI_FLUSH_INTERVAL_MS = 50
+DRAG_MOVE_INTERVAL_MS = 16
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+EDGE_CURSORS = {
+    Qt.Edge.TopEdge | Qt.Edge.LeftEdge: Qt.CursorShape.SizeFDiagCursor,
+    Qt.Edge.BottomEdge | Qt.Edge.RightEdge: Qt.CursorShape.SizeFDiagCursor,
+    Qt.Edge.TopEdge | Qt.Edge.RightEdge: Qt.CursorShape.SizeBDiagCursor,
+    Qt.Edge.BottomEdge | Qt.Edge.LeftEdge: Qt.CursorShape.SizeBDiagCursor,
+    Qt.Edge.TopEdge: Qt.CursorShape.SizeVerCursor,
+    Qt.Edge.BottomEdge: Qt.CursorShape.SizeVerCursor,
+    Qt.Edge.LeftEdge: Qt.CursorShape.SizeHorCursor,
+    Qt.Edge.RightEdge: Qt.CursorShape.SizeHorCursor,
+}
+
+
+def _edge_for(on_top, on_bottom, on_left, on_right):
+    """Edge priority used by check_edge: corners first, then top/bottom, then sides."""
+    if on_top and on_left: return Qt.Edge.TopEdge | Qt.Edge.LeftEdge
+    if on_top and on_right: return Qt.Edge.TopEdge | Qt.Edge.RightEdge
+    if on_bottom and on_right: return Qt.Edge.BottomEdge | Qt.Edge.RightEdge
+    if on_bottom and on_left: return Qt.Edge.BottomEdge | Qt.Edge.LeftEdge
+    if on_top: return Qt.Edge.TopEdge
+    if on_bottom: return Qt.Edge.BottomEdge
+    if on_left: return Qt.Edge.LeftEdge
+    if on_right: return Qt.Edge.RightEdge
+    return None
+
+
+# Indexed by (on_top << 3) | (on_bottom << 2) | (on_left << 1) | on_right
+EDGE_TABLE = tuple(
+    _edge_for(bool(i & 8), bool(i & 4), bool(i & 2), bool(i & 1)) for i in range(16)
+)
 
 class OverlayWindow(QMainWindow):
     # Signal emitted when config is saved/loaded/changed permanently
@@ -53,6 +86,10 @@ class OverlayWindow(QMainWindow):
         self.resize_margin = 10
         self.min_width = 120
         self.min_height = 80
+        # Points inside this rect are never on a resize edge (kept in resizeEvent)
+        self._interior_rect = QRect()
+        # Edge whose resize cursor is currently set (None = default cursor)
+        self._cursor_edge = None
 
         # Resize Handle (Visual Grip)
         self.grip = QSizeGrip(self)
@@ -96,18 +133,31 @@ class OverlayWindow(QMainWindow):
         self.chat_history = deque(maxlen=MAX_VISIBLE_MESSAGES)
         self._pending_messages = []
         self._style_state = {}
+        # Bumped whenever a message colour changes; cached per-message HTML
+        # from an older version is re-rendered on next use.
+        self._colors_version = 0
         self._needs_full_refresh = False
         self._flush_timer = QTimer(self)
         self._flush_timer.setSingleShot(True)
         self._flush_timer.setInterval(UI_FLUSH_INTERVAL_MS)
         self._flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self._flush_timer.timeout.connect(self._flush_pending_messages)
+        # Right-drag moves are coalesced to one move() per tick
+        self._pending_move_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(DRAG_MOVE_INTERVAL_MS)
+        self._move_timer.timeout.connect(self._apply_pending_move)
         # Track state of all sessions for context menu checkmarks
         self.all_session_states = {}
         # Track available characters for Local selection
         self.available_characters = {}
         # Track available fleets for Fleet selection
         self.available_fleets = {}
+        # Menu order, sorted once per registry update rather than per right-click
+        self._sorted_characters = []
+        # (fleet_id, label) pairs for the fleet submenu
+        self._fleet_menu_entries = []
         self.selected_fleet_id = None 
         
         self.apply_config()
@@ -131,7 +181,6 @@ class OverlayWindow(QMainWindow):
 
     def apply_config(self):
         screen_geo = QApplication.primaryScreen().availableGeometry()
-        needs_refresh = False
         
         # Apply Geometry
         x = self.config.get('x', -1)
@@ -148,8 +197,13 @@ class OverlayWindow(QMainWindow):
         new_geometry = QRect(x, y, w, h)
         if self.geometry() != new_geometry:
             self.setGeometry(new_geometry)
-        
-        # Apply visual settings
+
+        self._apply_visual_config()
+
+    def _apply_visual_config(self):
+        """Apply opacity, background, font and colours, touching only what changed."""
+        needs_refresh = False
+
         opacity = self.config.get('opacity', 0.8)
         if abs(self.windowOpacity() - opacity) > 0.001:
             self.setWindowOpacity(opacity)
@@ -166,12 +220,9 @@ class OverlayWindow(QMainWindow):
             self.text_browser.setFont(QFont("Arial", font_size))
             needs_refresh = True
 
-        color_state = (
-            self.config.get('color_default', '#e0e0e0'),
-            self.config.get('color_translated', '#00ffff'),
-            self.config.get('color_highlight', 'yellow'),
-        )
+        color_state = self._color_state()
         if self._style_state.get('colors') != color_state:
+            self._colors_version += 1
             needs_refresh = True
 
         self._style_state = {
@@ -186,6 +237,13 @@ class OverlayWindow(QMainWindow):
             else:
                 self._needs_full_refresh = True
 
+    def _color_state(self):
+        return (
+            self.config.get('color_default', '#e0e0e0'),
+            self.config.get('color_translated', '#00ffff'),
+            self.config.get('color_highlight', 'yellow'),
+        )
+
     def _update_config_from_geometry(self):
         geo = self.geometry()
         self.config['x'] = geo.x()
@@ -208,13 +266,17 @@ class OverlayWindow(QMainWindow):
 
     def showEvent(self, event):
         super().showEvent(event)
-        # Refresh UI when shown to catch up on any messages missed while hidden
-        self.refresh_ui()
+        # Catch up on messages or style changes that arrived while hidden
+        if self._needs_full_refresh:
+            self.refresh_ui()
 
     def resizeEvent(self, event):
         rect = self.rect()
         # Position grip at bottom right
         self.grip.move(rect.right() - self.grip.width(), rect.bottom() - self.grip.height())
+        m = self.resize_margin
+        # Same bounds check_edge treats as "no edge": m <= x <= width - m
+        self._interior_rect = QRect(m, m, rect.width() - 2 * m + 1, rect.height() - 2 * m + 1)
         # Since we use native resize, we might want to update config occasionally or just on close
         self._update_config_from_geometry()
         super().resizeEvent(event)
@@ -223,32 +285,34 @@ class OverlayWindow(QMainWindow):
         self._update_config_from_geometry()
         super().moveEvent(event)
 
+    def _apply_pending_move(self):
+        if self._pending_move_pos is not None:
+            self.move(self._pending_move_pos)
+            self._pending_move_pos = None
+
     def check_edge(self, pos):
         """Returns Qt.Edge identifier (combined for corners) or None"""
         r = self.rect()
         m = self.resize_margin
         
-        on_left = pos.x() < m
-        on_right = pos.x() > r.width() - m
-        on_top = pos.y() < m
-        on_bottom = pos.y() > r.height() - m
-        
-        if on_top and on_left: return Qt.Edge.TopEdge | Qt.Edge.LeftEdge
-        if on_top and on_right: return Qt.Edge.TopEdge | Qt.Edge.RightEdge
-        if on_bottom and on_right: return Qt.Edge.BottomEdge | Qt.Edge.RightEdge
-        if on_bottom and on_left: return Qt.Edge.BottomEdge | Qt.Edge.LeftEdge
-        if on_top: return Qt.Edge.TopEdge
-        if on_bottom: return Qt.Edge.BottomEdge
-        if on_left: return Qt.Edge.LeftEdge
-        if on_right: return Qt.Edge.RightEdge
-        return None
+        x = pos.x()
+        y = pos.y()
+
+        return EDGE_TABLE[
+            (y < m) << 3 | (y > r.height() - m) << 2 | (x < m) << 1 | (x > r.width() - m)
+        ]
+
+    def _window_pos(self, source, event):
+        """Event position in window coordinates, mapped from the filtered child widget."""
+        pos = event.position().toPoint()
+        return pos if source is self else source.mapTo(self, pos)
 
     def eventFilter(self, source, event):
         if event.type() == QEvent.Type.MouseButtonPress:
             if isinstance(event, QMouseEvent):
                 if event.button() == Qt.MouseButton.LeftButton:
                     # Check for resize
-                    local_pos = event.position().toPoint()
+                    local_pos = self._window_pos(source, event)
                     edge = self.check_edge(local_pos)
                     if edge:
                         self.windowHandle().startSystemResize(edge)
@@ -264,21 +328,21 @@ class OverlayWindow(QMainWindow):
         elif event.type() == QEvent.Type.MouseMove:
             if isinstance(event, QMouseEvent):
                 # Handle Cursor Shape
-                local_pos = event.position().toPoint()
-                edge = self.check_edge(local_pos)
-                
+                local_pos = self._window_pos(source, event)
+                # Most moves are in the interior; skip edge detection there
+                if self._interior_rect.contains(local_pos):
+                    edge = None
+                else:
+                    edge = self.check_edge(local_pos)
+
                 if edge:
-                    if edge == (Qt.Edge.TopEdge | Qt.Edge.LeftEdge) or edge == (Qt.Edge.BottomEdge | Qt.Edge.RightEdge):
-                        self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-                    elif edge == (Qt.Edge.TopEdge | Qt.Edge.RightEdge) or edge == (Qt.Edge.BottomEdge | Qt.Edge.LeftEdge):
-                        self.setCursor(Qt.CursorShape.SizeBDiagCursor)
-                    elif edge == Qt.Edge.TopEdge or edge == Qt.Edge.BottomEdge:
-                        self.setCursor(Qt.CursorShape.SizeVerCursor)
-                    elif edge == Qt.Edge.LeftEdge or edge == Qt.Edge.RightEdge:
-                        self.setCursor(Qt.CursorShape.SizeHorCursor)
+                    if edge != self._cursor_edge:
+                        self.setCursor(EDGE_CURSORS[edge])
+                        self._cursor_edge = edge
                     return True # Consume event to keep cursor
-                else:
+                elif self._cursor_edge is not None:
                     self.unsetCursor()
+                    self._cursor_edge = None
 
                 # Handle Manual Move
                 if getattr(self, 'is_moving', False):
@@ -286,8 +350,11 @@ class OverlayWindow(QMainWindow):
                      diff = global_pos - self.drag_start_pos
                      if diff.manhattanLength() > 5:
                           self.has_moved = True
-                          self.move(self.pos() + diff)
+                          base = self._pending_move_pos if self._pending_move_pos is not None else self.pos()
+                          self._pending_move_pos = base + diff
                           self.drag_start_pos = global_pos
+                          if not self._move_timer.isActive():
+                               self._move_timer.start()
                      return True
 
         elif event.type() == QEvent.Type.MouseButtonRelease:
@@ -297,6 +364,8 @@ class OverlayWindow(QMainWindow):
                        if not self.has_moved:
                             self.show_context_menu()
                        else:
+                            self._move_timer.stop()
+                            self._apply_pending_move()
                             self.save_config()
                        return True
 
@@ -333,14 +402,8 @@ class OverlayWindow(QMainWindow):
             # Current selection
             current_char_id = self.config.get('character_id')
 
-            if self.available_characters:
-                # Sort by name
-                sorted_chars = sorted(
-                    self.available_characters.values(),
-                    key=lambda x: x.character_name
-                )
-
-                for char_info in sorted_chars:
+            if self._sorted_characters:
+                for char_info in self._sorted_characters:
                     char_name = char_info.character_name
                     system = f" ({char_info.system_name})" if char_info.system_name else ""
                     is_active = " [Offline]" if not char_info.is_active else ""
@@ -364,26 +427,11 @@ class OverlayWindow(QMainWindow):
             # Current selection
             current_fleet_id = getattr(self, 'selected_fleet_id', None)
 
-            if self.available_fleets:
-                # Sort by creation time (newest first)
-                sorted_fleets = sorted(
-                    self.available_fleets.values(),
-                    key=lambda x: x.created_time,
-                    reverse=True
-                )
-
-                for fleet_info in sorted_fleets:
-                    # Format time ID
-                    dt = datetime.datetime.fromtimestamp(fleet_info.created_time)
-                    time_str = dt.strftime("%H:%M")
-                    
-                    label = f"Fleet - {fleet_info.listener_name} [{time_str}]"
-                    is_inactive = " [Inactive]" if not fleet_info.is_active else ""
-                    label += is_inactive
-
+            if self._fleet_menu_entries:
+                for fleet_id, label in self._fleet_menu_entries:
                     action = QAction(label, self, checkable=True)
-                    action.setChecked(fleet_info.fleet_id == current_fleet_id)
-                    action.triggered.connect(lambda checked, fid=fleet_info.fleet_id: self.fleet_selected.emit(fid))
+                    action.setChecked(fleet_id == current_fleet_id)
+                    action.triggered.connect(lambda checked, fid=fleet_id: self.fleet_selected.emit(fid))
                     menu_fleets.addAction(action)
             else:
                 act = QAction("No active fleets detected", self)
@@ -414,50 +462,36 @@ class OverlayWindow(QMainWindow):
 
     def preview_settings(self, new_config):
         # Apply incoming settings temporarily
-        old_opacity = self.config.get('opacity', 0.8)
         self.config.update(new_config)
-        
-        # Apply visual changes immediately
-        new_opacity = self.config.get('opacity', 0.8)
-        if new_opacity != old_opacity:
-            self.setWindowOpacity(new_opacity)
-
-        # Only refresh UI if visual properties changed that affect content
-        # For now, we just refresh since Font/Color might have changed.
-        # But we avoided the spam from text inputs.
-        self.refresh_ui()
+        # Window-only changes (opacity, background) don't rebuild the document;
+        # font or colour changes do
+        self._apply_visual_config()
 
     def export_chat(self):
         filename, _ = QFileDialog.getSaveFileName(self, "Export Chat", "", "Text Files (*.txt)")
         if filename:
             try:
                 with open(filename, 'w', encoding='utf-8') as f:
-                    for msg in self.chat_history:
-                        line = f"[{msg['timestamp']}] {msg['sender']} > "
-                        
-                        clean_text = self._strip_html(msg['text'])
-                        
-                        if msg['is_translated']:
-                            clean_orig = self._strip_html(msg['original_text'])
-                            line += f"{clean_text} ({clean_orig})"
-                        else:
-                            line += f"{clean_text}"
-                            
-                        f.write(line + "\n")
+                    f.writelines(self._export_line(msg) for msg in self.chat_history)
                 QMessageBox.information(self, "Export", "Chat history exported successfully.")
             except Exception as e:
                 QMessageBox.warning(self, "Export Error", str(e))
 
+    def _export_line(self, msg) -> str:
+        """Format one history entry as a plain-text export line."""
+        clean_text = self._strip_html(msg['text'])
+        if msg['is_translated']:
+            clean_orig = self._strip_html(msg['original_text'])
+            return f"[{msg['timestamp']}] {msg['sender']} > {clean_text} ({clean_orig})\n"
+        return f"[{msg['timestamp']}] {msg['sender']} > {clean_text}\n"
+
     def _strip_html(self, text: str) -> str:
         """Remove HTML tags and unescape entities."""
         if not text:
             return ""
-        # Strip tags: look for <...>
-        # Non-greedy or greedy? <[^>]+> is fairly standard for simple tags.
-        text = re.sub(r'<[^>]+>', '', text)
-        # Unescape entities (&lt; -> <, etc)
-        text = html.unescape(text)
-        return text
+        # Strip tags (<[^>]+> is fairly standard for simple tags), then
+        # unescape entities (&lt; -> <, etc)
+        return html.unescape(_TAG_RE.sub('', text))
 
     def set_styling(self):
         # Semi-transparent background for readability? 
@@ -469,7 +503,7 @@ class OverlayWindow(QMainWindow):
         if self._flush_timer.isActive():
             self._flush_timer.stop()
 
-        full_html = "".join(self._format_message_html(msg_data) for msg_data in self.chat_history)
+        full_html = "".join(self._message_html(msg_data) for msg_data in self.chat_history)
             
         self.text_browser.setHtml(full_html)
         self._needs_full_refresh = False
@@ -500,15 +534,26 @@ class OverlayWindow(QMainWindow):
 
         pending = self._pending_messages
         self._pending_messages = []
-        self.text_browser.setUpdatesEnabled(False)
-        try:
-            for msg_data in pending:
-                self.text_browser.append(self._format_message_html(msg_data))
-        finally:
-            self.text_browser.setUpdatesEnabled(True)
-            
-        if self.config.get('auto_scroll', True):
-             self.text_browser.moveCursor(QTextCursor.MoveOperation.End)
+        # Only follow new messages if the user hasn't scrolled up to read history
+        scroll_bar = self.text_browser.verticalScrollBar()
+        follow = self.config.get('auto_scroll', True) and scroll_bar.value() >= scroll_bar.maximum() - 2
+        # One append for the whole batch: each <div> still becomes its own block
+        # (so setMaximumBlockCount trims per message), but the document is
+        # inserted and laid out once.
+        self.text_browser.append(
+            "".join(self._message_html(msg_data) for msg_data in pending)
+        )
+
+        if follow:
+            # Scroll the view directly; the text cursor doesn't need to move
+            scroll_bar.setValue(scroll_bar.maximum())
+
+    def _message_html(self, msg_data):
+        """Return the message's HTML, reusing the cached copy while colours are unchanged."""
+        if msg_data.get('_colors_version') != self._colors_version:
+            msg_data['_html'] = self._format_message_html(msg_data)
+            msg_data['_colors_version'] = self._colors_version
+        return msg_data['_html']
 
     def _format_message_html(self, msg_data):
         """Helper to format a single message dict into HTML string."""
@@ -518,16 +563,17 @@ class OverlayWindow(QMainWindow):
 
         timestamp = msg_data['timestamp']
         sender = msg_data['sender']
-        # Safe to replace on copy
-        text = msg_data['text'].replace("color: yellow", f"color: {col_high}")
+        # Highlights arrive marked yellow; with the default colour there is nothing to swap
+        recolor = col_high != 'yellow'
+        text = msg_data['text']
+        if recolor:
+            text = text.replace("color: yellow", f"color: {col_high}")
 
         if msg_data['is_translated']:
-            original = msg_data['original_text']
             # Ensure original is not None before replace (though unlikely if is_translated)
-            if original:
+            original = msg_data['original_text'] or ""
+            if recolor:
                 original = original.replace("color: yellow", f"color: {col_high}")
-            else:
-                original = ""
                 
             return (f"<div style='margin-bottom: 2px;'>"
                     f"<span style='color: {col_def};'>[{timestamp}] {sender} &gt; </span>"
@@ -561,11 +607,26 @@ class OverlayWindow(QMainWindow):
     def update_character_list(self, character_registry: dict):
         """Update list of available characters for context menu."""
         self.available_characters = character_registry
+        # Sort by name
+        self._sorted_characters = sorted(
+            character_registry.values(),
+            key=lambda x: x.character_name
+        )
 
     def update_fleet_list(self, fleet_registry: dict, selected_fleet_id: str):
         """Update list of available fleets for context menu."""
         self.available_fleets = fleet_registry
         self.selected_fleet_id = selected_fleet_id
+        # Sort by creation time (newest first) and format labels once per update
+        entries = []
+        for fleet_info in sorted(fleet_registry.values(), key=lambda x: x.created_time, reverse=True):
+            # Format time ID
+            time_str = datetime.datetime.fromtimestamp(fleet_info.created_time).strftime("%H:%M")
+            is_inactive = " [Inactive]" if not fleet_info.is_active else ""
+            entries.append(
+                (fleet_info.fleet_id, f"Fleet - {fleet_info.listener_name} [{time_str}]{is_inactive}")
+            )
+        self._fleet_menu_entries = entries
 
     def clear_messages(self):
         """Clear all messages from the overlay."""
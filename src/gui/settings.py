@@ -1,14 +1,26 @@
-import copy
 import os
+import re
+from functools import partial
 
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-                               QSlider, QSpinBox, QCheckBox, QPushButton,
+                               QSlider, QSpinBox, QDoubleSpinBox, QCheckBox, QPushButton,
                                QColorDialog, QFormLayout, QGroupBox, QWidget, QTabWidget,
                                QFileDialog, QLineEdit)
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QColor
 from src.version import __version__
 
+# Widget edits within this window are coalesced into one settings_changed
+SETTINGS_PREVIEW_DEBOUNCE_MS = 150
+
+COLOR_BUTTON_QSS = "background-color: %s;"
+
+# Ignored languages may be separated by commas and/or whitespace
+_LANG_SPLIT = re.compile(r'[,\s]+')
+
+# Starting folder for the log directory picker when none is set
+_DEFAULT_DOCS = os.path.expanduser("~/Documents")
+
 class SettingsDialog(QDialog):
     # Signal carrying the updated config dict (full structure)
     settings_changed = Signal(dict)
@@ -17,8 +29,21 @@ class SettingsDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle(f"Global Settings - v{__version__}")
         self.resize(400, 500)
-        # Deep copy config to allow reversion/modification
-        self.config = copy.deepcopy(full_config)
+        # Copy each level the dialog writes into, so edits never reach full_config.
+        # Leaves are only ever replaced (get_settings builds a new ignored_languages
+        # list), so they can be shared instead of deep-copied.
+        self.config = dict(
+            full_config,
+            shared=full_config['shared'].copy(),
+            sessions={sid: cfg.copy() for sid, cfg in full_config['sessions'].items()},
+        )
+
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(SETTINGS_PREVIEW_DEBOUNCE_MS)
+        self._notify_timer.timeout.connect(self._emit_settings_changed)
+        # Created on first pick and reused by every colour button
+        self._color_dialog = None
         
         self.main_layout = QVBoxLayout(self)
         
@@ -32,13 +57,20 @@ class SettingsDialog(QDialog):
         
         # 2. Fleet Tab
         self.tab_fleet = QWidget()
-        self._init_session_tab(self.tab_fleet, 'fleet')
         self.tabs.addTab(self.tab_fleet, "Fleet Overlay")
         
         # 3. Local Tab
         self.tab_local = QWidget()
-        self._init_session_tab(self.tab_local, 'local')
         self.tabs.addTab(self.tab_local, "Local Overlay")
+
+        # Session tabs are populated the first time they are selected
+        self._built_session_tabs = set()
+        self._reset_labels = {}
+        self._pending_session_tabs = {
+            self.tabs.indexOf(self.tab_fleet): (self.tab_fleet, 'fleet'),
+            self.tabs.indexOf(self.tab_local): (self.tab_local, 'local'),
+        }
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Buttons
         btn_box = QHBoxLayout()
@@ -55,12 +87,13 @@ class SettingsDialog(QDialog):
 
     def _init_shared_tab(self):
         layout = QVBoxLayout(self.tab_shared)
+        shared = self.config['shared']
         
         # Paths Group
         grp_paths = QGroupBox("Paths")
         form_paths = QFormLayout(grp_paths)
         
-        self.edit_log_dir = QLineEdit(self.config['shared'].get('log_dir', ''))
+        self.edit_log_dir = QLineEdit(shared.get('log_dir', ''))
         self.edit_log_dir.setReadOnly(True)
         
         btn_browse = QPushButton("Browse...")
@@ -81,14 +114,14 @@ class SettingsDialog(QDialog):
         # Opacity
         self.slider_opacity = QSlider(Qt.Orientation.Horizontal)
         self.slider_opacity.setRange(20, 100)
-        self.slider_opacity.setValue(int(self.config['shared'].get('opacity', 0.8) * 100))
+        self.slider_opacity.setValue(int(shared.get('opacity', 0.8) * 100))
         self.slider_opacity.valueChanged.connect(self._notify_change)
         form.addRow("Opacity:", self.slider_opacity)
         
         # Font Size
         self.spin_font = QSpinBox()
         self.spin_font.setRange(8, 36)
-        self.spin_font.setValue(self.config['shared'].get('font_size', 10))
+        self.spin_font.setValue(shared.get('font_size', 10))
         self.spin_font.valueChanged.connect(self._notify_change)
         form.addRow("Font Size:", self.spin_font)
         
@@ -98,13 +131,13 @@ class SettingsDialog(QDialog):
         grp_colors = QGroupBox("Text Colors")
         form_col = QFormLayout(grp_colors)
         
-        self.btn_col_def = self._make_color_btn('color_default', self.config['shared'].get('color_default', '#e0e0e0'))
+        self.btn_col_def = self._make_color_btn('color_default', shared.get('color_default', '#e0e0e0'))
         form_col.addRow("Default Text:", self.btn_col_def)
         
-        self.btn_col_trans = self._make_color_btn('color_translated', self.config['shared'].get('color_translated', '#00ffff'))
+        self.btn_col_trans = self._make_color_btn('color_translated', shared.get('color_translated', '#00ffff'))
         form_col.addRow("Translated:", self.btn_col_trans)
         
-        self.btn_col_high = self._make_color_btn('color_highlight', self.config['shared'].get('color_highlight', 'yellow'))
+        self.btn_col_high = self._make_color_btn('color_highlight', shared.get('color_highlight', 'yellow'))
         form_col.addRow("Highlights:", self.btn_col_high)
         
         layout.addWidget(grp_colors)
@@ -114,21 +147,21 @@ class SettingsDialog(QDialog):
         form_beh = QFormLayout(grp_beh)
         
         self.chk_autoscroll = QCheckBox("Auto-scroll")
-        self.chk_autoscroll.setChecked(self.config['shared'].get('auto_scroll', True))
+        self.chk_autoscroll.setChecked(shared.get('auto_scroll', True))
         self.chk_autoscroll.stateChanged.connect(self._notify_change)
         form_beh.addRow(self.chk_autoscroll)
         
-        self.edit_target = self._make_line_edit(self.config['shared'].get('target_language', 'en'))
+        self.edit_target = self._make_line_edit(shared.get('target_language', 'en'))
         form_beh.addRow("Target Lang (ISO):", self.edit_target)
         
         # Ignored
-        ign = self.config['shared'].get('ignored_languages', [])
+        ign = shared.get('ignored_languages', [])
         ign_str = ", ".join(ign) if isinstance(ign, list) else str(ign)
         self.edit_ignored = self._make_line_edit(ign_str)
         form_beh.addRow("Ignored Langs:", self.edit_ignored)
         
         # API Key
-        self.edit_deepl = self._make_line_edit(self.config['shared'].get('deepl_api_key', ''))
+        self.edit_deepl = self._make_line_edit(shared.get('deepl_api_key', ''))
         self.edit_deepl.setPlaceholderText("Leave empty for Google")
         form_beh.addRow("DeepL API Key:", self.edit_deepl)
         
@@ -138,15 +171,10 @@ class SettingsDialog(QDialog):
         grp_perf = QGroupBox("Performance")
         form_perf = QFormLayout(grp_perf)
         
-        # Need to import QDoubleSpinBox inside init or at top. 
-        # It's not imported at top: QSpinBox is, but not QDoubleSpinBox.
-        # Let's import it locally to be safe or rely on existing imports if any.
-        from PySide6.QtWidgets import QDoubleSpinBox
-        
         self.spin_poll = QDoubleSpinBox()
         self.spin_poll.setRange(0.1, 10.0)
         self.spin_poll.setSingleStep(0.1)
-        self.spin_poll.setValue(float(self.config['shared'].get('polling_interval', 1.0)))
+        self.spin_poll.setValue(float(shared.get('polling_interval', 1.0)))
         self.spin_poll.setSuffix(" sec")
         self.spin_poll.valueChanged.connect(self._notify_change)
         
@@ -160,9 +188,16 @@ class SettingsDialog(QDialog):
         
         layout.addStretch()
 
+    def _on_tab_changed(self, index):
+        pending = self._pending_session_tabs.pop(index, None)
+        if pending:
+            self._init_session_tab(*pending)
+
     def _init_session_tab(self, tab_widget, session_id):
+        self._built_session_tabs.add(session_id)
         layout = QVBoxLayout(tab_widget)
         
+        shared = self.config['shared']
         session_cfg = self.config['sessions'][session_id]
         
         # Visibility check? (Just implicit via enable/disable in tray)
@@ -174,7 +209,7 @@ class SettingsDialog(QDialog):
             # Fleet inactivity threshold (minutes)
             self.spin_fleet_threshold = QSpinBox()
             self.spin_fleet_threshold.setRange(1, 120)  # 1-120 minutes
-            threshold_seconds = self.config['shared'].get('fleet_inactive_threshold', 1800)
+            threshold_seconds = shared.get('fleet_inactive_threshold', 1800)
             self.spin_fleet_threshold.setValue(threshold_seconds // 60)  # Convert to minutes
             self.spin_fleet_threshold.setSuffix(" min")
             self.spin_fleet_threshold.valueChanged.connect(self._notify_change)
@@ -182,14 +217,14 @@ class SettingsDialog(QDialog):
 
             # Auto-switch on inactive
             self.chk_fleet_autoswitch = QCheckBox("Auto-switch when current fleet becomes inactive")
-            self.chk_fleet_autoswitch.setChecked(self.config['shared'].get('fleet_auto_switch', True))
+            self.chk_fleet_autoswitch.setChecked(shared.get('fleet_auto_switch', True))
             self.chk_fleet_autoswitch.stateChanged.connect(self._notify_change)
             form_fleet.addRow(self.chk_fleet_autoswitch)
 
             # Fleet Scan Interval (seconds)
             self.spin_fleet_interval = QSpinBox()
             self.spin_fleet_interval.setRange(5, 300)  # 5s to 5 minutes
-            self.spin_fleet_interval.setValue(self.config['shared'].get('fleet_scan_interval', 10))
+            self.spin_fleet_interval.setValue(shared.get('fleet_scan_interval', 10))
             self.spin_fleet_interval.setSuffix(" sec")
             self.spin_fleet_interval.valueChanged.connect(self._notify_change)
             form_fleet.addRow("Scan Interval:", self.spin_fleet_interval)
@@ -197,7 +232,7 @@ class SettingsDialog(QDialog):
             # Backfill History Lines
             self.spin_fleet_history = QSpinBox()
             self.spin_fleet_history.setRange(0, 50) # 0 to 50 lines
-            self.spin_fleet_history.setValue(self.config['shared'].get('fleet_history_lines', 5))
+            self.spin_fleet_history.setValue(shared.get('fleet_history_lines', 5))
             self.spin_fleet_history.setSuffix(" lines")
             self.spin_fleet_history.valueChanged.connect(self._notify_change)
             form_fleet.addRow("History Lines:", self.spin_fleet_history)
@@ -210,53 +245,77 @@ class SettingsDialog(QDialog):
         # Background Color (Each session can have distinct BG)
         bg_col = session_cfg.get('background_color', '#000000')
         btn_bg = QPushButton()
-        btn_bg.setStyleSheet(f"background-color: {bg_col};")
+        btn_bg.setStyleSheet(COLOR_BUTTON_QSS % bg_col)
         # Need to store ref to retrieve value later? 
         # Or cleaner: update config immediately on pick?
         # But we want 'Cancel' to revert.
-        # So we store transient value in 'self.config' via lambda
-        btn_bg.clicked.connect(lambda: self._pick_color_session(btn_bg, session_id, 'background_color'))
+        # So we store transient value in 'self.config' via the bound handler
+        btn_bg.clicked.connect(partial(self._pick_color_session, btn_bg, session_id, 'background_color'))
         form.addRow("Background Color:", btn_bg)
         
         layout.addWidget(grp_layout)
         
         # Position Reset
         btn_reset = QPushButton("Reset Position to Default")
-        btn_reset.clicked.connect(lambda: self._reset_position(session_id))
+        btn_reset.clicked.connect(partial(self._reset_position, session_id))
         layout.addWidget(btn_reset)
+
+        # Feedback for the reset button; one label reused across clicks
+        lbl_reset = QLabel("")
+        layout.addWidget(lbl_reset)
+        self._reset_labels[session_id] = lbl_reset
         
         layout.addStretch()
 
     def _make_color_btn(self, shared_key, initial_hex):
         btn = QPushButton()
-        btn.setStyleSheet(f"background-color: {initial_hex};")
-        btn.clicked.connect(lambda: self._pick_color_shared(btn, shared_key))
+        btn.setStyleSheet(COLOR_BUTTON_QSS % initial_hex)
+        btn.clicked.connect(partial(self._pick_color_shared, btn, shared_key))
         return btn
         
     def _make_line_edit(self, text):
-        from PySide6.QtWidgets import QLineEdit
         le = QLineEdit(text)
         return le
 
     def _notify_change(self, *args):
+        # Restart the window so a slider drag emits once it settles
+        self._notify_timer.start()
+
+    def _emit_settings_changed(self):
         self.settings_changed.emit(self.get_settings())
 
+    def done(self, result):
+        # A preview firing after Save/Cancel would override the restored config
+        self._notify_timer.stop()
+        super().done(result)
+
+    def _get_color(self, initial):
+        """Run the shared colour dialog; returns an invalid QColor on cancel."""
+        if self._color_dialog is None:
+            self._color_dialog = QColorDialog(self)
+            self._color_dialog.setWindowTitle("Pick Color")
+        self._color_dialog.setCurrentColor(QColor(initial))
+        if self._color_dialog.exec() == QDialog.DialogCode.Accepted:
+            return self._color_dialog.selectedColor()
+        return QColor()
+
     def _pick_color_shared(self, btn, key):
         curr = self.config['shared'].get(key, '#ffffff')
-        c = QColorDialog.getColor(QColor(curr), self, "Pick Color")
-        if c.isValid():
+        c = self._get_color(curr)
+        # Re-picking the current colour needs no restyle or preview
+        if c.isValid() and c.name() != curr:
             h = c.name()
             self.config['shared'][key] = h
-            btn.setStyleSheet(f"background-color: {h};")
+            btn.setStyleSheet(COLOR_BUTTON_QSS % h)
             self._notify_change()
             
     def _pick_color_session(self, btn, session_id, key):
         curr = self.config['sessions'][session_id].get(key, '#000000')
-        c = QColorDialog.getColor(QColor(curr), self, "Pick Color")
-        if c.isValid():
+        c = self._get_color(curr)
+        if c.isValid() and c.name() != curr:
             h = c.name()
             self.config['sessions'][session_id][key] = h
-            btn.setStyleSheet(f"background-color: {h};")
+            btn.setStyleSheet(COLOR_BUTTON_QSS % h)
             self._notify_change()
 
     def _reset_position(self, session_id):
@@ -265,41 +324,39 @@ class SettingsDialog(QDialog):
         self.config['sessions'][session_id]['y'] = -1
         self.config['sessions'][session_id]['w'] = 600
         self.config['sessions'][session_id]['h'] = 400
-        # Feedback? 
-        lbl = QLabel("Position reset pending save.")
-        self.sender().parent().layout().addWidget(lbl) # Hacky feedback
+        self._reset_labels[session_id].setText("Position reset pending save.")
 
     def get_settings(self):
         # Collect values from widgets that aren't auto-updated
 
         # Shared
-        self.config['shared']['opacity'] = self.slider_opacity.value() / 100.0
-        self.config['shared']['font_size'] = self.spin_font.value()
-        self.config['shared']['auto_scroll'] = self.chk_autoscroll.isChecked()
-        self.config['shared']['target_language'] = self.edit_target.text().strip()
-        self.config['shared']['deepl_api_key'] = self.edit_deepl.text().strip()
+        shared = self.config['shared']
+        shared['opacity'] = self.slider_opacity.value() / 100.0
+        shared['font_size'] = self.spin_font.value()
+        shared['auto_scroll'] = self.chk_autoscroll.isChecked()
+        shared['target_language'] = self.edit_target.text().strip()
+        shared['deepl_api_key'] = self.edit_deepl.text().strip()
 
         ign_raw = self.edit_ignored.text()
-        self.config['shared']['ignored_languages'] = [x.strip() for x in ign_raw.split(',') if x.strip()]
+        shared['ignored_languages'] = [lang for lang in _LANG_SPLIT.split(ign_raw) if lang]
 
-        self.config['shared']['log_dir'] = self.edit_log_dir.text()
+        shared['log_dir'] = self.edit_log_dir.text()
 
         # Fleet Chat Settings (Always available as Global Settings)
-        self.config['shared']['fleet_inactive_threshold'] = self.spin_fleet_threshold.value() * 60
-        self.config['shared']['fleet_auto_switch'] = self.chk_fleet_autoswitch.isChecked()
-        self.config['shared']['fleet_scan_interval'] = self.spin_fleet_interval.value()
-        self.config['shared']['fleet_history_lines'] = self.spin_fleet_history.value()
+        # Unvisited tab: its widgets don't exist and the config is untouched
+        if 'fleet' in self._built_session_tabs:
+            shared['fleet_inactive_threshold'] = self.spin_fleet_threshold.value() * 60
+            shared['fleet_auto_switch'] = self.chk_fleet_autoswitch.isChecked()
+            shared['fleet_scan_interval'] = self.spin_fleet_interval.value()
+            shared['fleet_history_lines'] = self.spin_fleet_history.value()
              
         # Save Performance Settings
-        self.config['shared']['polling_interval'] = self.spin_poll.value()
+        shared['polling_interval'] = self.spin_poll.value()
              
         return self.config
 
     def _browse_log_dir(self):
-        current = self.edit_log_dir.text()
-        if not current:
-            current = os.path.expanduser("~/Documents")
-            
+        current = self.edit_log_dir.text() or _DEFAULT_DOCS
         d = QFileDialog.getExistingDirectory(self, "Select EVE Chatlogs Folder", current)
         if d:
             self.edit_log_dir.setText(d)
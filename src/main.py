@@ -2,9 +2,7 @@ import sys
 import os
 import logging
 import logging.handlers
-import glob
 from pathlib import Path
-import copy
 import traceback
 from src.utils.paths import get_resource_path
 
@@ -47,6 +45,7 @@ from src.core.detector import LanguageDetector
 from src.app_config import (
     ConfigStore,
     SHARED_CONFIG_KEYS,
+    copy_config,
     filter_session_config,
     remove_shared_keys_from_sessions,
     sanitize_config_for_log,
@@ -55,10 +54,17 @@ from src.services.processing import LogProcessingWorker, WorkerSignals
 from src.services.scan_state import ChatScanState
 from src.services.translator import TranslationService
 from src.services.local_detector import LocalChatDetector
+from src.services.fleet_detector import FleetDetector
 from src.gui.settings import SettingsDialog
 from src.version import __version__
 
 DIR_SCAN_DEBOUNCE_MS = 500
+CONFIG_SAVE_DEBOUNCE_MS = 500
+# Shared keys read only by the worker and the log scanner; sessions ignore them
+NON_SESSION_CONFIG_KEYS = frozenset({
+    'ignored_languages', 'target_language', 'deepl_api_key',
+    'log_dir', 'fleet_auto_switch', 'fleet_scan_interval',
+})
 WATCHED_DIR_FALLBACK_SECONDS = 60
 
 class TranslatorManager(QObject):
@@ -115,14 +121,21 @@ class TranslatorManager(QObject):
         # In Dev: src/assets/icon.png relative to root
         # In Frozen: src/assets/icon.png relative to _MEIPASS
         icon_path = get_resource_path(os.path.join('src', 'assets', 'icon.png'))
-        if os.path.exists(icon_path):
-            self.app.setWindowIcon(QIcon(icon_path))
+        # Decoded once and reused for the tray icon
+        self._app_icon = QIcon(icon_path) if os.path.exists(icon_path) else None
+        if self._app_icon is not None:
+            self.app.setWindowIcon(self._app_icon)
         else:
             logger.warning(f"Icon not found at {icon_path}")
 
         # Configuration
         self.config_store = ConfigStore()
         self.config = self._load_config()
+        # Coalesce bursts of config changes into a single disk write
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(CONFIG_SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._save_config_now)
 
         # Shared Processing Components
         parser = LineParser()
@@ -134,7 +147,7 @@ class TranslatorManager(QObject):
         self.thread = QThread()
         self.worker = LogProcessingWorker(parser, tokenizer, detector, translator_service)
         self.worker.moveToThread(self.thread)
-        self.worker.signals.message_ready.connect(self._route_message)
+        self.worker.signals.messages_ready.connect(self._route_messages)
         self.thread.start()
 
         # Initial config sync
@@ -142,9 +155,19 @@ class TranslatorManager(QObject):
 
         # Sessions
         self.sessions = {}
+        # session_id -> config last pushed by _apply_config_update
+        self._last_applied_session_cfg = {}
+        # session_id -> finder returning the log file that session should tail
+        self._log_finders = {
+            'fleet': self._find_latest_fleet_log,
+            'local': self._find_latest_local_log,
+        }
 
         # Chat log scan state
         self._scan_state = ChatScanState.from_config(self.config)
+        # Shared so their per-file metadata caches survive between scans
+        self._fleet_detector = FleetDetector()
+        self._local_detector = LocalChatDetector()
 
         # Periodic scanner timer (check every X seconds for characters and fleets)
         # Scan interval is configurable, defaulting to 10s as per user request (legacy default was 30s)
@@ -182,6 +205,22 @@ class TranslatorManager(QObject):
     def _get_configured_log_dir(self):
         return self.config['shared'].get('log_dir', '')
 
+    def _get_valid_log_dir(self):
+        """Return the configured log dir if it exists, else None.
+
+        A positive check is remembered for that path so periodic scans skip the
+        stat; the watcher refresh below re-validates it on directory changes.
+        """
+        log_dir = self._get_configured_log_dir()
+        if not log_dir:
+            return None
+        if log_dir == getattr(self, '_validated_log_dir', None):
+            return log_dir
+        if os.path.exists(log_dir):
+            self._validated_log_dir = log_dir
+            return log_dir
+        return None
+
     def _configured_scan_interval_ms(self):
         return max(1000, int(self.config['shared'].get('fleet_scan_interval', 10) * 1000))
 
@@ -206,7 +245,9 @@ class TranslatorManager(QObject):
             watcher.removePath(watched)
 
         log_dir = self._get_configured_log_dir()
+        self._validated_log_dir = None
         if log_dir and os.path.isdir(log_dir):
+            self._validated_log_dir = log_dir
             self._log_dir_watch_active = watcher.addPath(log_dir)
 
         self._restart_scanner_timer()
@@ -220,8 +261,27 @@ class TranslatorManager(QObject):
 
     def _handle_debounced_directory_scan(self):
         self._configure_log_directory_watcher()
+        # Scans read log contents (listener headers, "System changed" lines) and
+        # fleet activity by mtime, so any written file needs one. Only skip the
+        # scan when no file was created, removed or modified since the last one.
+        log_snapshot = self._log_dir_snapshot(self._get_configured_log_dir())
+        if log_snapshot is not None and log_snapshot == getattr(self, '_scanned_log_snapshot', None):
+            return
+        self._scanned_log_snapshot = log_snapshot
         self._periodic_scan()
 
+    def _log_dir_snapshot(self, log_dir):
+        """(log_dir, {(name, mtime, size), ...}) for the directory, or None if unreadable."""
+        files = set()
+        try:
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    stat = entry.stat()
+                    files.add((entry.name, stat.st_mtime, stat.st_size))
+        except OSError:
+            return None
+        return (log_dir, frozenset(files))
+
     def _apply_scanner_config(self):
         self._configure_log_directory_watcher()
 
@@ -270,6 +330,18 @@ class TranslatorManager(QObject):
         return config_store.load()
 
     def _save_config(self):
+        """Schedule a config write; restarting the timer pushes the deadline out."""
+        save_timer = getattr(self, '_save_timer', None)
+        if save_timer is None:
+            self._save_config_now()
+            return
+        save_timer.start()
+
+    def _save_config_now(self):
+        save_timer = getattr(self, '_save_timer', None)
+        if save_timer is not None:
+            save_timer.stop()
+
         # Update session configs
         for session_id, session in self.sessions.items():
             if session:
@@ -290,9 +362,9 @@ class TranslatorManager(QObject):
     def _setup_system_tray(self):
         self.tray_icon = QSystemTrayIcon(self.app)
         # Try to use application icon
-        icon_path = get_resource_path(os.path.join('src', 'assets', 'icon.png'))
-        if os.path.exists(icon_path):
-            self.tray_icon.setIcon(QIcon(icon_path))
+        app_icon = getattr(self, '_app_icon', None)
+        if app_icon is not None:
+            self.tray_icon.setIcon(app_icon)
         else:
             # Fallback: Create a simple pixmap
             from PySide6.QtGui import QPixmap, QPainter, QColor
@@ -352,6 +424,7 @@ class TranslatorManager(QObject):
 
         session_config = self._build_session_config(session_id)
         session = ChatSession(session_id, log_path, session_config, parent=self)
+        self._last_applied_session_cfg.pop(session_id, None)
         
         session.lines_ready.connect(self.worker.process_lines)
         session.request_toggle.connect(self.toggle_session) # Handle context menu requests
@@ -377,7 +450,7 @@ class TranslatorManager(QObject):
         """Open the global settings dialog."""
         try:
             # Backup current config for restore on Cancel
-            original_config = copy.deepcopy(self.config)
+            original_config = copy_config(self.config)
 
             dlg = SettingsDialog(self.config, parent=None)
             
@@ -429,6 +502,14 @@ class TranslatorManager(QObject):
             if session:
                 # Re-build session config (merges shared + specific)
                 new_session_config = self._build_session_config(session_id)
+                # Worker-only changes (e.g. target language) leave the overlay alone
+                session_visible = {
+                    key: value for key, value in new_session_config.items()
+                    if key not in NON_SESSION_CONFIG_KEYS
+                }
+                if session_visible == self._last_applied_session_cfg.get(session_id):
+                    continue
+                self._last_applied_session_cfg[session_id] = session_visible
                 logger.info(f"[{session_id}] Applying Config Update. Font: {new_session_config.get('font_size')}, Opacity: {new_session_config.get('opacity')}")
                 session.update_config(new_session_config)
 
@@ -492,6 +573,9 @@ class TranslatorManager(QObject):
             if key in updated_config:
                 self.config['sessions'][session_id][key] = updated_config[key]
 
+        # The overlay changed itself, so what was last pushed no longer describes it
+        self._last_applied_session_cfg = {}
+
         # Notify worker of shared config changes
         self.worker.update_config(self.config['shared'])
         self._apply_scanner_config()
@@ -511,19 +595,16 @@ class TranslatorManager(QObject):
         self.local_action.setChecked(self.config['sessions']['local'].get('enabled', False))
 
     def _get_log_path(self, session_id):
-        if session_id == 'fleet':
-            return self._find_latest_fleet_log()
-        elif session_id == 'local':
-            return self._find_latest_local_log()
-        return None
+        finder = self._log_finders.get(session_id)
+        return finder() if finder else None
 
     def _find_latest_fleet_log(self):
         """
         Get the fleet log path to use.
         Priority: 1) Selected fleet from config, 2) Most recent active fleet
         """
-        log_dir = self._get_configured_log_dir()
-        if not log_dir or not os.path.exists(log_dir):
+        log_dir = self._get_valid_log_dir()
+        if not log_dir:
             return None
 
         # Try selected fleet first
@@ -532,10 +613,10 @@ class TranslatorManager(QObject):
             logger.info(f"[FLEET] Using selected fleet: {fleet_info.listener_name}")
             return fleet_info.log_path
 
+        detector = self._fleet_detector
+
         # No selected fleet or it's not active - find most recent
         if self.fleet_registry:
-            from src.services.fleet_detector import FleetDetector
-            detector = FleetDetector()
             most_recent = detector.get_most_recent_fleet(self.fleet_registry)
             if most_recent:
                 logger.info(f"[FLEET] Auto-selecting most recent fleet: {most_recent.listener_name}")
@@ -544,22 +625,18 @@ class TranslatorManager(QObject):
                 return most_recent.log_path
 
         # Fallback to old behavior (scan directory directly)
-        pattern = os.path.join(log_dir, "Fleet_*.txt")
-        files = glob.glob(pattern)
-        if not files:
-            return None
-        return max(files, key=os.path.getmtime)
+        return detector.get_most_recent_fleet_log(log_dir)
 
     def _find_latest_local_log(self):
         """
         Get log path for Local session.
         Uses selected character if set, otherwise most recent.
         """
-        log_dir = self._get_configured_log_dir()
-        if not log_dir or not os.path.exists(log_dir):
+        log_dir = self._get_valid_log_dir()
+        if not log_dir:
             return None
             
-        detector = LocalChatDetector()
+        detector = self._local_detector
 
         # If character selected, get their latest log
         if self.selected_character_id:
@@ -619,16 +696,17 @@ class TranslatorManager(QObject):
         - Auto-switch when current fleet becomes inactive (if enabled)
         - Does NOT auto-switch when newer fleets appear
         """
-        log_dir = self._get_configured_log_dir()
-        if not log_dir or not os.path.exists(log_dir):
+        log_dir = self._get_valid_log_dir()
+        if not log_dir:
             return
 
-        from src.services.fleet_detector import FleetDetector
-        detector = FleetDetector()
+        detector = self._fleet_detector
 
         # Get user-configured threshold
         threshold = self.config['shared'].get('fleet_inactive_threshold', 1800)
-        new_registry = detector.scan_active_fleets(log_dir, active_threshold_seconds=threshold)
+        new_registry = detector.scan_active_fleets(
+            log_dir, active_threshold_seconds=threshold, previous=self.fleet_registry
+        )
 
         # Get auto-switch setting
         auto_switch_enabled = self.config['shared'].get('fleet_auto_switch', True)
@@ -696,11 +774,11 @@ class TranslatorManager(QObject):
         - Characters logging out (stale logs)
         - Log file rotations (client restarts)
         """
-        log_dir = self._get_configured_log_dir()
-        if not log_dir or not os.path.exists(log_dir):
+        log_dir = self._get_valid_log_dir()
+        if not log_dir:
             return
 
-        detector = LocalChatDetector()
+        detector = self._local_detector
         new_registry = detector.scan_active_characters(log_dir)
 
         # Check if selected character's log changed
@@ -837,10 +915,10 @@ class TranslatorManager(QObject):
         specific = self.config['sessions'][session_id].copy()
         return {**shared, **specific}
 
-    @Slot(str, str, str, str, str, bool)
-    def _route_message(self, session_id, text, sender, timestamp, original, is_trans):
+    @Slot(str, list)
+    def _route_messages(self, session_id, messages):
         if session_id in self.sessions and self.sessions[session_id]:
-            self.sessions[session_id].add_message(text, sender, timestamp, original, is_trans)
+            self.sessions[session_id].add_messages(messages)
 
     def shutdown(self):
         logger.info("Shutting down...")
@@ -857,7 +935,7 @@ class TranslatorManager(QObject):
                 # DON'T call stop_session() - it sets enabled=False
                 # We want to preserve user's preference for next startup
 
-        self._save_config()
+        self._save_config_now()
         self.thread.quit()
         self.thread.wait()
         self.app.quit()
@@ -17,6 +17,7 @@ class FleetDetector:
     """
 
     def __init__(self):
+        # path -> ((path, size, mtime), listener); one entry per file, replaced when it changes
         self._listener_cache = {}
 
     def _file_cache_key(self, filepath: str):
@@ -39,8 +40,9 @@ class FleetDetector:
             Character name or None if not found
         """
         cache_key = self._file_cache_key(filepath)
-        if cache_key in self._listener_cache:
-            return self._listener_cache[cache_key]
+        cached = self._listener_cache.get(cache_key[0]) if cache_key else None
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
         listener = None
         try:
@@ -58,7 +60,7 @@ class FleetDetector:
             pass
 
         if cache_key is not None:
-            self._listener_cache[cache_key] = listener
+            self._listener_cache[cache_key[0]] = (cache_key, listener)
         return listener
 
     def parse_timestamp_from_filename(self, filename: str) -> Optional[float]:
@@ -84,13 +86,15 @@ class FleetDetector:
                 pass
         return None
 
-    def scan_active_fleets(self, log_dir: str, active_threshold_seconds: int = 1800) -> Dict[str, FleetInfo]:
+    def scan_active_fleets(self, log_dir: str, active_threshold_seconds: int = 1800,
+                           previous: Optional[Dict[str, FleetInfo]] = None) -> Dict[str, FleetInfo]:
         """
         Scan all Fleet chat logs and return active ones.
 
         Args:
             log_dir: Directory containing EVE chat logs
             active_threshold_seconds: Consider logs active if modified within this time (default 30 minutes)
+            previous: Result of the last scan; entries whose log mtime is unchanged are reused as-is
 
         Returns:
             Dict mapping fleet_id (log path) -> FleetInfo
@@ -111,6 +115,12 @@ class FleetDetector:
                             if age_seconds > active_threshold_seconds:
                                 continue  # Skip inactive logs
 
+                            # Unchanged since the last scan: nothing to reparse
+                            known = previous.get(entry.path) if previous else None
+                            if known is not None and known.log_mtime == mtime:
+                                result[entry.path] = known
+                                continue
+
                             # Parse listener name from log header
                             listener_name = self.parse_listener_from_log(entry.path)
                             if not listener_name:
@@ -144,6 +154,38 @@ class FleetDetector:
 
         return result
 
+    def get_most_recent_fleet_log(self, log_dir: str) -> Optional[str]:
+        """
+        Get the most recently modified Fleet chat log in a single directory pass.
+
+        Args:
+            log_dir: Directory containing EVE chat logs
+
+        Returns:
+            Path of the newest Fleet_*.txt, or None if there is none
+        """
+        most_recent_file = None
+        most_recent_time = -1
+
+        try:
+            with os.scandir(log_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("Fleet_") and name.endswith(".txt") and entry.is_file():
+                        try:
+                            # entry.stat().st_mtime is cached on Windows
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            continue
+                        if mtime > most_recent_time:
+                            most_recent_time = mtime
+                            most_recent_file = entry.path
+        except OSError as e:
+            logger.error(f"Error scanning fleet logs: {e}")
+            return None
+
+        return most_recent_file
+
     def get_most_recent_fleet(self, fleets: Dict[str, FleetInfo]) -> Optional[FleetInfo]:
         """
         Get the most recently created fleet from a dict of fleets.
@@ -23,6 +23,7 @@ class LocalChatDetector:
     """
 
     def __init__(self):
+        # path -> ((path, size, mtime), value); one entry per file, replaced when it changes
         self._character_cache = {}
         self._system_cache = {}
 
@@ -51,8 +52,9 @@ class LocalChatDetector:
         "EVE System > Channel changed to Local : <SYSTEM_NAME>"
         """
         cache_key = self._file_cache_key(filepath)
-        if cache_key in self._system_cache:
-            return self._system_cache[cache_key]
+        cached = self._system_cache.get(cache_key[0]) if cache_key else None
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
         last_system = None
         try:
@@ -71,7 +73,7 @@ class LocalChatDetector:
         except (OSError, UnicodeError):
             pass
         if cache_key is not None:
-            self._system_cache[cache_key] = last_system
+            self._system_cache[cache_key[0]] = (cache_key, last_system)
         return last_system
 
     def is_character_window_open(self, char_name: str) -> bool:
@@ -243,8 +245,9 @@ class LocalChatDetector:
         Reads first ~15 lines looking for "Listener: <CharacterName>".
         """
         cache_key = self._file_cache_key(filepath)
-        if cache_key in self._character_cache:
-            return self._character_cache[cache_key]
+        cached = self._character_cache.get(cache_key[0]) if cache_key else None
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
 
         character_name = None
         try:
@@ -261,5 +264,5 @@ class LocalChatDetector:
         except (OSError, UnicodeError):
             pass
         if cache_key is not None:
-            self._character_cache[cache_key] = character_name
+            self._character_cache[cache_key[0]] = (cache_key, character_name)
         return character_name
@@ -1,13 +1,26 @@
-import html
 import logging
+from dataclasses import dataclass
+from typing import Any, Optional
 
 from PySide6.QtCore import QObject, Signal, Slot
 
+from src.core.tokenizer import escape_html, restore_placeholders
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _PreparedLine:
+    msg: Any
+    tokenized: Any
+    should_translate: bool
+    detected_lang: Optional[str]
+    result: Optional[tuple[str, bool, str]] = None
+
+
 class WorkerSignals(QObject):
-    message_ready = Signal(str, str, str, str, str, bool)
+    # (session_id, [(text, sender, timestamp, original, is_translated), ...]) per process_lines call
+    messages_ready = Signal(str, list)
 
 
 class LogProcessingWorker(QObject):
@@ -27,61 +40,95 @@ class LogProcessingWorker(QObject):
     @Slot(dict)
     def update_config(self, config):
         self.config = config.copy()
-        self.translator_service.set_config(self.config)
+        # Provider construction (DeepL client setup) must not block the caller
+        self.translator_service.set_config(self.config, background=True)
 
     @Slot(str, list)
     def process_lines(self, session_id: str, lines: list):
+        prepared = []
         for line in lines:
             try:
-                self._process_single_line(session_id, line)
+                item = self._prepare_line(line)
+            except Exception as exc:
+                logger.error("[%s] Error processing line: %s", session_id, exc)
+                continue
+            if item is not None:
+                prepared.append(item)
+
+        # One translation request per detected source language instead of one per line.
+        batches = {}
+        for item in prepared:
+            if item.should_translate:
+                batches.setdefault(item.detected_lang, []).append(item)
+
+        target_lang = self.config.get('target_language', 'en')
+        for source_lang, items in batches.items():
+            try:
+                results = self.translator_service.translate_batch(
+                    [item.tokenized.cleaned for item in items],
+                    target_lang, source_lang=source_lang
+                )
+            except Exception as exc:
+                logger.error("[%s] Error processing line: %s", session_id, exc)
+                results = [None] * len(items)
+            for item, result in zip(items, results):
+                item.result = result
+
+        messages = []
+        for item in prepared:
+            try:
+                message = self._render_line(session_id, item)
             except Exception as exc:
                 logger.error("[%s] Error processing line: %s", session_id, exc)
+                continue
+            if message is not None:
+                messages.append(message)
 
-    def _process_single_line(self, session_id: str, line: str):
+        # One queued cross-thread delivery for the whole burst
+        if messages:
+            self.signals.messages_ready.emit(session_id, messages)
+
+    def _prepare_line(self, line: str) -> Optional[_PreparedLine]:
         msg = self.parser.parse(line, 0)
         if not msg:
-            return
+            return None
 
         tokenized = self.tokenizer.tokenize(msg.message)
 
+        # Repeated chat ("o7", fleet calls) is served by the detector's own LRU
         ignored = set(self.config.get('ignored_languages', ['en']))
         should_translate, detected_lang = self.detector.should_translate(
             tokenized.cleaned, ignored_langs=ignored
         )
+        return _PreparedLine(msg, tokenized, should_translate, detected_lang)
 
+    def _render_line(self, session_id: str, item: _PreparedLine):
+        """Build the (text, sender, timestamp, original, is_translated) message for a line."""
+        msg, tokenized = item.msg, item.tokenized
         timestamp_str = msg.timestamp.strftime("%H:%M:%S")
 
-        if not should_translate:
-            final_text = self._restore_with_highlight(tokenized.cleaned, tokenized.tokens)
-            self.signals.message_ready.emit(
-                session_id, final_text, msg.sender,
-                timestamp_str, "", False
+        if not item.should_translate:
+            final_text = self._restore_with_highlight(tokenized.cleaned, tokenized.tokens_html)
+            return (final_text, msg.sender, timestamp_str, "", False)
+
+        if item.result is None:
+            # The batch translation call itself raised; already logged.
+            return None
+
+        translated_text, success, provider = item.result
+        # Guarded so the argument building is skipped per line when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[%s] [%s] %s: %r -> %r",
+                session_id.upper(), provider, "Success" if success else "Failed",
+                tokenized.cleaned, translated_text
             )
-            return
-
-        target_lang = self.config.get('target_language', 'en')
-        translated_text, success, provider = self.translator_service.translate_message(
-            tokenized.cleaned, target_lang, source_lang=detected_lang
-        )
 
-        status = "Success" if success else "Failed"
-        logger.debug(
-            "[%s] [%s] %s: %r -> %r",
-            session_id.upper(), provider, status, tokenized.cleaned, translated_text
-        )
+        final_text = self._restore_with_highlight(translated_text, tokenized.tokens_html)
+        final_original = self._restore_with_highlight(tokenized.cleaned, tokenized.tokens_html)
 
-        final_text = self._restore_with_highlight(translated_text, tokenized.tokens)
-        final_original = self._restore_with_highlight(tokenized.cleaned, tokenized.tokens)
-
-        self.signals.message_ready.emit(
-            session_id, final_text, msg.sender,
-            timestamp_str, final_original, True
-        )
+        return (final_text, msg.sender, timestamp_str, final_original, True)
 
-    def _restore_with_highlight(self, text, tokens):
-        safe_text = html.escape(text)
-        for placeholder, original in tokens.items():
-            safe_original = html.escape(original)
-            highlighted = f"<span style='color: yellow;'>{safe_original}</span>"
-            safe_text = safe_text.replace(placeholder, highlighted)
-        return safe_text
+    def _restore_with_highlight(self, text, tokens_html):
+        # Escaping leaves placeholders intact; one regex pass swaps them all
+        return restore_placeholders(escape_html(text), tokens_html)
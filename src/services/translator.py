@@ -1,11 +1,18 @@
 import logging
+import threading
 from collections import OrderedDict
 from abc import ABC, abstractmethod
+from functools import partial
 from deep_translator import GoogleTranslator
+from PySide6.QtCore import QThreadPool
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 TRANSLATION_CACHE_SIZE = 512
+# Provider calls allowed in flight at once; further callers wait for a slot
+# rather than piling onto a provider that is already rate limiting (429).
+MAX_CONCURRENT_TRANSLATIONS = {'deepl': 8, 'google': 4}
+DEFAULT_MAX_CONCURRENT_TRANSLATIONS = 8
 
 class TranslationProvider(ABC):
     @property
@@ -17,6 +24,10 @@ class TranslationProvider(ABC):
     def translate(self, text: str, target_lang: str = 'en', source_lang: str = None) -> Optional[str]:
         pass
 
+    def translate_batch(self, texts: list[str], target_lang: str = 'en', source_lang: str = None) -> list[Optional[str]]:
+        """Translate several texts, returning None for each one that failed."""
+        return [self.translate(text, target_lang, source_lang) for text in texts]
+
 class MockTranslator(TranslationProvider):
     @property
     def name(self) -> str:
@@ -63,7 +74,7 @@ class DeepLProvider(TranslationProvider):
     def name(self) -> str:
         return "DeepL"
 
-    def translate(self, text: str, target_lang: str = 'en', source_lang: str = None) -> Optional[str]:
+    def _translate_args(self, target_lang: str, source_lang: str = None) -> dict:
         # Map target languages usually 'en' -> 'EN-US' for DeepL logic
         lang_map = {
             'en': 'EN-US',
@@ -93,7 +104,10 @@ class DeepLProvider(TranslationProvider):
                 # DeepL might detect it as something else valid, or return error if really unsupported,
                 # but we avoid 400 "Value not supported" for the param itself.
                 pass
-            
+        return args
+
+    def translate(self, text: str, target_lang: str = 'en', source_lang: str = None) -> Optional[str]:
+        args = self._translate_args(target_lang, source_lang)
         try:
             result = self.translator.translate_text(text, **args)
             return result.text
@@ -101,6 +115,17 @@ class DeepLProvider(TranslationProvider):
             logger.error(f"Translation Error (DeepL): {e}")
             return None
 
+    def translate_batch(self, texts: list[str], target_lang: str = 'en', source_lang: str = None) -> list[Optional[str]]:
+        # translate_text accepts a list and returns results in the same order,
+        # so a burst of lines costs one HTTP round trip instead of one each.
+        args = self._translate_args(target_lang, source_lang)
+        try:
+            results = self.translator.translate_text(list(texts), **args)
+            return [result.text for result in results]
+        except Exception as e:
+            logger.error(f"Translation Error (DeepL): {e}")
+            return [None] * len(texts)
+
 from src.core.glossary import EVEGlossary
 
 class TranslationService:
@@ -114,12 +139,24 @@ class TranslationService:
         self._provider_mode = self.provider.name.lower()
         self._deepl_api_key = ""
         self._translation_cache = OrderedDict()
+
+        # Provider swaps may be built on a pool thread; the generation lets the
+        # most recent request win if several builds are in flight. The lock
+        # also guards _translation_cache, which such a swap clears.
+        self._provider_lock = threading.Lock()
+        self._requested_provider = (self._provider_mode, "")
+        self._provider_generation = 0
+        self._translation_slots = self._make_translation_slots(self._provider_mode)
         
         # Initialize Glossary
         self.glossary = EVEGlossary(source_lang='zh', target_lang='en')
 
-    def set_config(self, config: dict):
-        """Update configuration and reload glossary if needed."""
+    def set_config(self, config: dict, background: bool = False):
+        """Update configuration and reload glossary if needed.
+
+        With background=True a provider swap is built on the global
+        QThreadPool and the current provider keeps serving until it is ready.
+        """
         target_lang = config.get('target_language', 'en')
         
         # Reload glossary if target language changed
@@ -129,72 +166,134 @@ class TranslationService:
             self.glossary = EVEGlossary(source_lang='zh', target_lang=target_lang)
             self._clear_translation_cache()
 
-        self.set_provider_from_key(config.get('deepl_api_key', ''))
+        self.set_provider_from_key(config.get('deepl_api_key', ''), background=background)
 
-    def set_provider_from_key(self, deepl_api_key: str):
+    def set_provider_from_key(self, deepl_api_key: str, background: bool = False):
         """Select the translation provider from the configured DeepL API key."""
         normalized_key = (deepl_api_key or '').strip()
+        requested = ('deepl', normalized_key) if normalized_key else ('google', "")
+
+        with self._provider_lock:
+            if requested == self._requested_provider:
+                return
+            self._requested_provider = requested
+            self._provider_generation += 1
+            generation = self._provider_generation
+
+        if background:
+            QThreadPool.globalInstance().start(partial(self._build_provider, requested, generation))
+        else:
+            self._build_provider(requested, generation)
 
-        if normalized_key:
-            if self._provider_mode != 'deepl' or self._deepl_api_key != normalized_key:
-                logger.info("Switching to DeepL Provider")
-                self.provider = DeepLProvider(normalized_key)
-                self._provider_mode = 'deepl'
-                self._deepl_api_key = normalized_key
-                self._clear_translation_cache()
+    def _build_provider(self, requested: tuple[str, str], generation: int):
+        mode, api_key = requested
+        try:
+            provider = DeepLProvider(api_key) if mode == 'deepl' else GoogleTransProvider()
+        except Exception as e:
+            logger.error(f"Failed to create {mode} provider: {e}")
+            with self._provider_lock:
+                if generation == self._provider_generation:
+                    # Let the next config update retry the same settings
+                    self._requested_provider = (self._provider_mode, self._deepl_api_key)
             return
 
-        if self._provider_mode != 'google':
-            logger.info("Switching to Google Provider")
-            self.provider = GoogleTransProvider()
-            self._clear_translation_cache()
+        with self._provider_lock:
+            if generation != self._provider_generation:
+                return
+            logger.info(f"Switching to {provider.name} Provider")
+            self.provider = provider
+            self._provider_mode = mode
+            self._deepl_api_key = api_key
+            self._translation_slots = self._make_translation_slots(mode)
+            self._translation_cache.clear()
 
-        self._provider_mode = 'google'
-        self._deepl_api_key = ""
+    @staticmethod
+    def _make_translation_slots(provider_mode: str) -> threading.BoundedSemaphore:
+        limit = MAX_CONCURRENT_TRANSLATIONS.get(provider_mode, DEFAULT_MAX_CONCURRENT_TRANSLATIONS)
+        return threading.BoundedSemaphore(limit)
 
     def _clear_translation_cache(self):
-        self._translation_cache.clear()
+        with self._provider_lock:
+            self._translation_cache.clear()
 
-    def _cache_key(self, message: str, target_lang: str, source_lang: str = None):
+    def _cache_key(self, message: str, target_lang: str, source_lang: str = None, provider_mode: str = None):
         normalized_source = (source_lang or 'auto').lower()
         return (
-            self._provider_mode,
+            provider_mode or self._provider_mode,
             (target_lang or 'en').lower(),
             normalized_source,
             message,
         )
 
     def _get_cached_translation(self, key):
-        if key not in self._translation_cache:
-            return None
-        translated = self._translation_cache.pop(key)
-        self._translation_cache[key] = translated
-        return translated
+        with self._provider_lock:
+            if key not in self._translation_cache:
+                return None
+            translated = self._translation_cache.pop(key)
+            self._translation_cache[key] = translated
+            return translated
 
     def _store_cached_translation(self, key, translated: str):
-        self._translation_cache[key] = translated
-        if len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
-            self._translation_cache.popitem(last=False)
+        with self._provider_lock:
+            self._translation_cache[key] = translated
+            if len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+                self._translation_cache.popitem(last=False)
 
     def translate_message(self, message: str, target_lang: str = 'en', source_lang: str = None) -> tuple[str, bool, str]:
-        if not message.strip():
-            return message, True, self.provider.name
-        
-        # Apply Glossary Replacement (Pre-translation)
-        # Replaces known EVE terms (like '毒蜥') with English ('Gila')
-        # This helps DeepL context and ensures correct terminology.
-        preprocessed = self.glossary.replace_terms(message)
-
-        cache_key = self._cache_key(preprocessed, target_lang, source_lang)
-        cached = self._get_cached_translation(cache_key)
-        if cached is not None:
-            return cached, True, self.provider.name
-        
-        translated = self.provider.translate(preprocessed, target_lang, source_lang)
-        if translated:
-            self._store_cached_translation(cache_key, translated)
-            return translated, True, self.provider.name
-        else:
-            # If translation fails, return preprocessed (glossary applied) at least?
-            # Or original? Usually original is safer if API fails completely.
-            return message, False, self.provider.name
+        return self.translate_batch([message], target_lang, source_lang)[0]
+
+    def translate_batch(self, messages: list[str], target_lang: str = 'en', source_lang: str = None) -> list[tuple[str, bool, str]]:
+        """Translate messages sharing one language pair with a single provider call.
+
+        Returns a (text, success, provider_name) tuple per message, in order.
+        Cache hits and duplicates within the batch are not sent to the provider.
+        """
+        # Snapshot so a swap mid-batch cannot file one provider's output under another's key
+        with self._provider_lock:
+            provider, provider_mode = self.provider, self._provider_mode
+            translation_slots = self._translation_slots
+        provider_name = provider.name
+        results = [None] * len(messages)
+        # cache key -> (preprocessed text, indices of messages awaiting it)
+        pending = OrderedDict()
+
+        for index, message in enumerate(messages):
+            if not message.strip():
+                results[index] = (message, True, provider_name)
+                continue
+
+            # Apply Glossary Replacement (Pre-translation)
+            # Replaces known EVE terms (like '毒蜥') with English ('Gila')
+            # This helps DeepL context and ensures correct terminology.
+            preprocessed = self.glossary.replace_terms(message)
+
+            cache_key = self._cache_key(preprocessed, target_lang, source_lang, provider_mode)
+            cached = self._get_cached_translation(cache_key)
+            if cached is not None:
+                results[index] = (cached, True, provider_name)
+                continue
+
+            if cache_key in pending:
+                pending[cache_key][1].append(index)
+            else:
+                pending[cache_key] = (preprocessed, [index])
+
+        if pending:
+            texts = [preprocessed for preprocessed, _ in pending.values()]
+            with translation_slots:
+                if len(texts) == 1:
+                    translations = [provider.translate(texts[0], target_lang, source_lang)]
+                else:
+                    translations = provider.translate_batch(texts, target_lang, source_lang)
+            for (cache_key, (_, indices)), translated in zip(pending.items(), translations):
+                if translated:
+                    self._store_cached_translation(cache_key, translated)
+                for index in indices:
+                    if translated:
+                        results[index] = (translated, True, provider_name)
+                    else:
+                        # If translation fails, return the original message;
+                        # it is safer than a half-processed glossary string.
+                        results[index] = (messages[index], False, provider_name)
+
+        return results
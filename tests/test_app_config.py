@@ -2,8 +2,9 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from src.app_config import ConfigStore, sanitize_config_for_log
+from src.app_config import ConfigStore, copy_config, get_default_config, sanitize_config_for_log
 
 
 class TestConfigStore(unittest.TestCase):
@@ -56,6 +57,37 @@ class TestConfigStore(unittest.TestCase):
         self.assertEqual(saved['sessions']['fleet']['x'], 100)
         self.assertNotIn('opacity', saved['sessions']['fleet'])
 
+    def test_save_replaces_file_atomically(self):
+        self.store.save({'shared': {'opacity': 0.5}, 'sessions': {}})
+
+        with patch('src.app_config.os.replace', side_effect=OSError("disk full")):
+            self.store.save({'shared': {'opacity': 0.9}, 'sessions': {}})
+
+        with open(self.primary, 'r', encoding='utf-8') as config_file:
+            self.assertEqual(json.load(config_file)['shared']['opacity'], 0.5)
+        self.assertEqual([p.name for p in self.primary.parent.iterdir()], [self.primary.name])
+
+    def test_save_skips_unchanged_config(self):
+        config = {'shared': {'opacity': 0.5}, 'sessions': {'fleet': {'x': 1, 'y': 2}}}
+        self.store.save(config)
+
+        with patch('src.app_config.os.replace') as mock_replace:
+            self.store.save({'sessions': {'fleet': {'y': 2, 'x': 1}}, 'shared': {'opacity': 0.5}})
+            mock_replace.assert_not_called()
+
+            config['shared']['opacity'] = 0.6
+            self.store.save(config)
+            mock_replace.assert_called_once()
+
+    def test_failed_save_is_retried(self):
+        config = {'shared': {'opacity': 0.5}, 'sessions': {}}
+        with patch('src.app_config.os.replace', side_effect=OSError("locked")):
+            self.store.save(config)
+        self.store.save(config)
+
+        with open(self.primary, 'r', encoding='utf-8') as config_file:
+            self.assertEqual(json.load(config_file)['shared']['opacity'], 0.5)
+
     def test_sanitize_config_for_log_redacts_deepl_key(self):
         config = {
             'shared': {'deepl_api_key': 'secret-key'},
@@ -68,6 +100,17 @@ class TestConfigStore(unittest.TestCase):
         self.assertEqual(sanitized['sessions']['fleet']['deepl_api_key'], '<redacted>')
         self.assertEqual(config['shared']['deepl_api_key'], 'secret-key')
 
+    def test_copy_config_is_independent_deep_copy(self):
+        config = get_default_config()
+
+        copied = copy_config(config)
+
+        self.assertEqual(copied, config)
+        copied['shared']['ignored_languages'].append('de')
+        copied['sessions']['fleet']['x'] = 5
+        self.assertEqual(config['shared']['ignored_languages'], ['en'])
+        self.assertEqual(config['sessions']['fleet']['x'], 100)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,12 +2,13 @@ import os
 import pytest
 from datetime import datetime
 from src.core.parser import LineParser, ChatMessage
-from src.core.tokenizer import EVELinkTokenizer
+from src.core.tokenizer import EVELinkTokenizer, escape_html
 from src.core.tailer import FleetLogTailer
 from src.core.detector import LanguageDetector
 
 # --- Parser Tests ---
 import unittest
+from unittest.mock import patch
 
 class TestCoreComponents(unittest.TestCase):
 
@@ -37,6 +38,18 @@ class TestCoreComponents(unittest.TestCase):
         self.assertIsNone(parser.parse("Not a timestamp", 1))
         self.assertIsNone(parser.parse("----------------", 1))
 
+    def test_parser_timestamp_fields(self):
+        parser = LineParser()
+        msg = parser.parse("[ 2025.12.16 08:38:43 ] Pilot > o7", 1)
+        self.assertEqual(msg.timestamp, datetime(2025, 12, 16, 8, 38, 43))
+
+        # Extra whitespace between date and time still parses
+        msg = parser.parse("[ 2025.12.16  08:38:43 ] Pilot > o7", 1)
+        self.assertEqual(msg.timestamp, datetime(2025, 12, 16, 8, 38, 43))
+
+        # Out-of-range dates are rejected
+        self.assertIsNone(parser.parse("[ 2025.13.16 08:38:43 ] Pilot > o7", 1))
+
     # --- Tokenizer Tests ---
 
     def test_tokenizer_simple(self):
@@ -64,6 +77,64 @@ class TestCoreComponents(unittest.TestCase):
         restored = tokenizer.restore(tokenized.cleaned, tokenized.tokens)
         self.assertEqual(restored, original)
 
+    def test_tokenizer_link_boundaries(self):
+        tokenizer = EVELinkTokenizer()
+        # Printable characters stay in the link only while a control character follows
+        self.assertEqual(tokenizer._detect_eve_links("a\x1aXY"), [(1, 2, "\x1a")])
+        self.assertEqual(tokenizer._detect_eve_links("\x1aX\x03Y"), [(0, 3, "\x1aX\x03")])
+        # Non-ASCII data directly after a control character belongs to the link
+        self.assertEqual(tokenizer._detect_eve_links("\x85\xa0\u4f60 ok"), [(0, 3, "\x85\xa0\u4f60")])
+        self.assertEqual(tokenizer._detect_eve_links("no links here"), [])
+
+    def test_tokenizer_repeated_message_is_cached(self):
+        tokenizer = EVELinkTokenizer()
+        first = tokenizer.tokenize("Warp to \x1aA\x1a")
+        second = tokenizer.tokenize("Warp to \x1aA\x1a")
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first.tokens["__EVELINK_9__"] = "x"
+        with self.assertRaises(AttributeError):
+            first.cleaned = "changed"
+
+    def test_tokenizer_batch(self):
+        tokenizer = EVELinkTokenizer()
+        cleaned, tokens = tokenizer.tokenize_batch(["plain", "Go \x1aA\x1a"])
+        self.assertEqual(cleaned, ["plain", "Go __EVELINK_1__"])
+        self.assertEqual(tokens, [{}, {"__EVELINK_1__": "\x1aA\x1a"}])
+        self.assertEqual(tokenizer.tokenize_batch([]), ([], []))
+
+    def test_tokenizer_prebuilds_highlight_html(self):
+        tokenizer = EVELinkTokenizer()
+        tokenized = tokenizer.tokenize("Go \x1a<\x03&\x1a")
+        self.assertEqual(
+            dict(tokenized.tokens_html),
+            {"__EVELINK_1__": "<span style='color: yellow;'>\x1a&lt;\x03&amp;\x1a</span>"}
+        )
+        self.assertEqual(dict(tokenizer.tokenize("plain").tokens_html), {})
+
+    def test_tokenizer_plain_message_skips_regex(self):
+        tokenizer = EVELinkTokenizer()
+        with patch('src.core.tokenizer._LINK_RE') as mock_re:
+            tokenized = tokenizer.tokenize("Warp to 你好 @ 0km")
+        mock_re.sub.assert_not_called()
+        self.assertEqual(tokenized.cleaned, "Warp to 你好 @ 0km")
+        self.assertEqual(dict(tokenized.tokens), {})
+        self.assertEqual(dict(tokenized.tokens_html), {})
+        # Non-printable but not a link start (zero-width space): regex path, no tokens
+        self.assertEqual(dict(tokenizer.tokenize("a\u200bb").tokens), {})
+
+    def test_escape_html_only_touches_special_characters(self):
+        plain = "Warp to 你好 @ 0km"
+        self.assertIs(escape_html(plain), plain)
+        self.assertEqual(escape_html("a<b & 'c'"), "a&lt;b &amp; &#x27;c&#x27;")
+
+    def test_tokenizer_restore_single_pass(self):
+        tokenizer = EVELinkTokenizer()
+        tokens = {"__EVELINK_1__": "\x1aA\x1a", "__EVELINK_10__": "\x03"}
+        restored = tokenizer.restore("__EVELINK_10__ x __EVELINK_1__ __EVELINK_1__ __EVELINK_2__", tokens)
+        self.assertEqual(restored, "\x03 x \x1aA\x1a \x1aA\x1a __EVELINK_2__")
+        self.assertEqual(tokenizer.restore("plain", {}), "plain")
+
     # --- Tailer Tests ---
 
     def test_tailer_read(self):
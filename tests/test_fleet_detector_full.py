@@ -77,6 +77,8 @@ class TestFleetDetectorParsing(unittest.TestCase):
             self.assertEqual(self.detector.parse_listener_from_log(path), "NewPilotLonger")
 
         self.assertEqual(mock_open.call_count, 3)
+        # The stale entry is replaced, not kept alongside the new one
+        self.assertEqual(len(self.detector._listener_cache), 1)
 
     # --- parse_timestamp_from_filename ---
 
@@ -212,6 +214,31 @@ class TestFleetDetectorScanning(unittest.TestCase):
         self.assertIsNotNone(fleet.log_mtime)
         self.assertTrue(fleet.log_path.endswith(".txt"))
 
+    def test_scan_reuses_unchanged_fleets_from_previous(self):
+        """Logs with an unchanged mtime are taken from the previous scan without reparsing."""
+        now = time.time()
+        path = self._create_fleet_log("Fleet_20251216_082457.txt", "Pilot1", touch_time=now - 60)
+        first = self.detector.scan_active_fleets(self.test_dir)
+
+        with patch.object(self.detector, 'parse_listener_from_log') as mock_parse:
+            second = self.detector.scan_active_fleets(self.test_dir, previous=first)
+        mock_parse.assert_not_called()
+        self.assertIs(second[path], first[path])
+
+        # A new line bumps the mtime, so the entry is rebuilt
+        os.utime(path, (now - 5, now - 5))
+        third = self.detector.scan_active_fleets(self.test_dir, previous=second)
+        self.assertIsNot(third[path], first[path])
+        self.assertEqual(third[path].log_mtime, now - 5)
+
+    def test_scan_with_previous_still_drops_inactive_fleets(self):
+        path = self._create_fleet_log("Fleet_20251216_082457.txt", "Pilot1", touch_time=time.time() - 600)
+        first = self.detector.scan_active_fleets(self.test_dir)
+        self.assertIn(path, first)
+
+        result = self.detector.scan_active_fleets(self.test_dir, active_threshold_seconds=60, previous=first)
+        self.assertEqual(result, {})
+
     # --- get_most_recent_fleet ---
 
     def test_get_most_recent_fleet(self):
@@ -235,5 +262,23 @@ class TestFleetDetectorScanning(unittest.TestCase):
         self.assertEqual(result.listener_name, "SoloPilot")
 
 
+    # --- get_most_recent_fleet_log ---
+
+    def test_get_most_recent_fleet_log_picks_newest_mtime(self):
+        now = time.time()
+        self._create_fleet_log("Fleet_20251216_082457.txt", touch_time=now - 300)
+        newest = self._create_fleet_log("Fleet_20251215_082457.txt", touch_time=now - 10)
+        self._create_fleet_log("Fleet_20251214_082457.txt", touch_time=now - 600)
+        local = os.path.join(self.test_dir, "Local_20251216_082457_12345.txt")
+        with open(local, 'w', encoding='utf-16-le') as f:
+            f.write("test")
+
+        self.assertEqual(self.detector.get_most_recent_fleet_log(self.test_dir), newest)
+
+    def test_get_most_recent_fleet_log_missing(self):
+        self.assertIsNone(self.detector.get_most_recent_fleet_log(self.test_dir))
+        self.assertIsNone(self.detector.get_most_recent_fleet_log("/nonexistent/path"))
+
+
 if __name__ == '__main__':
     unittest.main()
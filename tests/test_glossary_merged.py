@@ -1,6 +1,7 @@
 import unittest
 import yaml
 from pathlib import Path
+from src.core import glossary as glossary_module
 from src.core.glossary import EVEGlossary
 
 def _flatten_terms(section: dict) -> dict:
@@ -38,6 +39,33 @@ class TestGlossaryMerged(unittest.TestCase):
         text = "Hello World"
         self.assertEqual(self.glossary.replace_terms(text), "Hello World")
 
+    def test_alnum_terms_respect_boundaries_next_to_cjk_terms(self):
+        """ASCII terms touching a CJK term are replaced, but never inside longer numbers."""
+        self.assertEqual(self.glossary.replace_terms("DMS终点"), "Deimos Destination")
+        self.assertEqual(self.glossary.replace_terms("88甲"), "Bye Armor")
+        self.assertNotIn("Nullsec", self.glossary.replace_terms("1600mm"))
+
+    def test_repeated_text_uses_cache(self):
+        """Repeated messages are served from the per-glossary cache."""
+        first = self.glossary.replace_terms("吉他收脑插")
+        second = self.glossary.replace_terms("吉他收脑插")
+        self.assertEqual(first, second)
+        self.assertEqual(self.glossary._replace_terms_cached.cache_info().hits, 1)
+
+    def test_text_without_trigger_chars_skips_matching(self):
+        """Messages sharing no first character with any term never reach the matcher."""
+        self.assertEqual(self.glossary.replace_terms("hello  there"), "hello there")
+        self.assertEqual(self.glossary._replace_terms_cached.cache_info().misses, 0)
+
+    @unittest.skipIf(glossary_module.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_regex_fallback(self):
+        """The Aho-Corasick literal pass resolves overlaps exactly like the regex."""
+        samples = ["大鱼王大鱼", "不要过门跟上舰队长", "抓到了抓人", "DMS终点", "吉他收脑插", "Hello"]
+        with_automaton = [self.glossary._replace_terms_uncached(t) for t in samples]
+        self.glossary._literal_automaton = None
+        with_regex = [self.glossary._replace_terms_uncached(t) for t in samples]
+        self.assertEqual(with_automaton, with_regex)
+
     def test_glossary_extended_ships(self):
         """Test extended ship list."""
         cases = [
@@ -104,6 +104,37 @@ ships:
         self.assertIn("打得不错", glossary.terms)
         self.assertEqual(glossary.terms["打得不错"], "Gutes Gefecht")
 
+    def test_unchanged_file_is_not_reparsed(self):
+        """Test that a second glossary reuses the cached parse of unchanged files."""
+        EVEGlossary('zh', 'en')
+        with patch.object(EVEGlossary, '_parse_yaml_glossary') as mock_parse:
+            glossary = EVEGlossary('zh', 'en')
+        mock_parse.assert_not_called()
+        self.assertEqual(glossary.terms["穿梭机"], "Shuttle")
+
+    def test_modified_custom_file_is_reparsed(self):
+        """Test that editing the custom glossary invalidates the cached parse."""
+        custom_file = self.glossary_dir / "custom_zh_en.yml"
+        custom_file.write_text("ships:\n  t:\n    穿梭机: Shuttle A\n", encoding='utf-8')
+        self.assertEqual(EVEGlossary('zh', 'en').terms["穿梭机"], "Shuttle A")
+
+        custom_file.write_text("ships:\n  t:\n    穿梭机: Shuttle BB\n", encoding='utf-8')
+        self.assertEqual(EVEGlossary('zh', 'en').terms["穿梭机"], "Shuttle BB")
+
+    def test_nested_sections_are_flattened(self):
+        """Test that nested sections flatten to string terms and 'meta' is skipped."""
+        custom_file = self.glossary_dir / "custom_zh_en.yml"
+        custom_file.write_text(
+            "meta:\n  version: '1'\n"
+            "ships:\n  t1:\n    a1: Alpha\n    deep:\n      b2: Beta\n    n3: 3\n",
+            encoding='utf-8'
+        )
+        terms = EVEGlossary('zh', 'en').terms
+        self.assertEqual(terms["a1"], "Alpha")
+        self.assertEqual(terms["b2"], "Beta")
+        self.assertNotIn("n3", terms)
+        self.assertNotIn("version", terms)
+
 if __name__ == '__main__':
     import unittest.mock
     unittest.main()
@@ -79,5 +79,22 @@ class TestIgnoredPhrases(unittest.TestCase):
             should, lang = detector.should_translate(text, ignored_langs=set())
             self.assertEqual((should, lang), (True, 'en'))
 
+    def test_invalid_pattern_is_skipped(self):
+        """Test that one broken regex does not disable the remaining patterns."""
+        data = {
+            'force_ignore': ['DoNotTranslateMe', '(unclosed'],
+            'slang': ['^o/$']
+        }
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            yaml.dump(data, f)
+
+        with patch('src.core.detector.get_resource_path', return_value=str(self.config_path)):
+            detector = LanguageDetector()
+
+            self.assertEqual(detector.should_translate("o/", 'en'), (False, 'ignored_keyword'))
+            self.assertEqual(
+                detector.should_translate("DoNotTranslateMe", 'en'), (False, 'ignored_keyword')
+            )
+
 if __name__ == '__main__':
     unittest.main()
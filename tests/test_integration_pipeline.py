@@ -67,14 +67,13 @@ class TestIntegrationPipeline(unittest.TestCase):
         # Session -> Worker
         self.session.lines_ready.connect(worker.process_lines)
         
-        # Worker -> Session (Custom slot to adapt arguments)
-        # Worker emits (session_id, text, sender, timestamp, original, is_translated)
-        # Session.add_message(text, sender, timestamp, original, is_translated)
-        def route_message(sid, text, sender, timestamp, orig, is_trans):
+        # Worker -> Session (Custom slot to route by session id)
+        # Worker emits (session_id, [(text, sender, timestamp, original, is_translated), ...])
+        def route_messages(sid, messages):
             if sid == self.session.session_id:
-                self.session.add_message(text, sender, timestamp, orig, is_trans)
+                self.session.add_messages(messages)
         
-        worker.signals.message_ready.connect(route_message)
+        worker.signals.messages_ready.connect(route_messages)
         
         # 4. Simulate Log Update
         # Write "Chinese" line -> Should be processed as "Mock Translated"
@@ -210,6 +210,7 @@ class TestLocalChatDetectorExtended(unittest.TestCase):
             self.assertEqual(self.detector.extract_system_name(path), "Amarr")
 
         self.assertEqual(mock_open.call_count, 3)
+        self.assertEqual(len(self.detector._system_cache), 1)
 
     # --- scan_active_characters ---
 
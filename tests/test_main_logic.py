@@ -8,6 +8,8 @@ import unittest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
 
+from PySide6.QtCore import QThreadPool
+
 
 class TestSharedConfigKeys(unittest.TestCase):
     """Verify the SHARED_CONFIG_KEYS constant is correct and complete."""
@@ -145,6 +147,25 @@ class TestConfigLoadSave(unittest.TestCase):
         # translator_config should win over legacy
         self.assertEqual(result['shared']['opacity'], 0.3)
 
+    def test_save_config_is_debounced_until_timer_fires(self):
+        """Bursts of _save_config calls should only write once, when the timer fires."""
+        from src.app_config import get_default_config
+        mgr = self._make_manager()
+        mgr.config = get_default_config()
+        mgr.sessions = {}
+        mgr._save_timer = MagicMock()
+
+        for _ in range(3):
+            mgr._save_config()
+
+        self.assertEqual(mgr._save_timer.start.call_count, 3)
+        self.assertFalse(self.config_path.exists())
+
+        mgr._save_config_now()
+        mgr._save_timer.stop.assert_called_once_with()
+        with open(self.config_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['shared']['opacity'], 0.8)
+
 
 class TestBuildSessionConfig(unittest.TestCase):
     """Tests for _build_session_config merging shared + session."""
@@ -203,6 +224,63 @@ class TestScannerWatcherConfig(unittest.TestCase):
             mgr._log_dir_watch_active = False
             self.assertEqual(mgr._scanner_interval_ms(), 120000)
 
+    def test_valid_log_dir_check_is_cached_per_path(self):
+        with patch('src.main.TranslatorManager.__init__', lambda self: None):
+            from src.main import TranslatorManager
+            mgr = TranslatorManager()
+        mgr.config = {'shared': {'log_dir': '/logs/a'}}
+
+        with patch('src.main.os.path.exists', return_value=True) as mock_exists:
+            self.assertEqual(mgr._get_valid_log_dir(), '/logs/a')
+            self.assertEqual(mgr._get_valid_log_dir(), '/logs/a')
+            self.assertEqual(mock_exists.call_count, 1)
+
+            # A different path is validated again
+            mgr.config['shared']['log_dir'] = '/logs/b'
+            self.assertEqual(mgr._get_valid_log_dir(), '/logs/b')
+            self.assertEqual(mock_exists.call_count, 2)
+
+        # Missing directories are re-checked every time until they appear
+        mgr.config['shared']['log_dir'] = '/logs/missing'
+        with patch('src.main.os.path.exists', return_value=False) as mock_exists:
+            self.assertIsNone(mgr._get_valid_log_dir())
+            self.assertIsNone(mgr._get_valid_log_dir())
+            self.assertEqual(mock_exists.call_count, 2)
+
+    def test_directory_event_rescans_whenever_a_log_changes(self):
+        with patch('src.main.TranslatorManager.__init__', lambda self: None):
+            from src.main import TranslatorManager
+            mgr = TranslatorManager()
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, log_dir, ignore_errors=True)
+        mgr.config = {'shared': {'log_dir': log_dir}}
+        mgr._configure_log_directory_watcher = MagicMock()
+        mgr._periodic_scan = MagicMock()
+        log_path = Path(log_dir) / "Local_20251201_095136_111.txt"
+        log_path.write_text("header")
+
+        mgr._handle_debounced_directory_scan()
+        self.assertEqual(mgr._periodic_scan.call_count, 1)
+
+        # A spurious event with nothing written does not rescan
+        mgr._handle_debounced_directory_scan()
+        self.assertEqual(mgr._periodic_scan.call_count, 1)
+
+        # An append can carry a "System changed" line or revive a fleet log
+        log_path.write_text("header\nline")
+        mgr._handle_debounced_directory_scan()
+        self.assertEqual(mgr._periodic_scan.call_count, 2)
+
+        # A touch that only moves the mtime counts too
+        os.utime(log_path, (1_700_000_000, 1_700_000_000))
+        mgr._handle_debounced_directory_scan()
+        self.assertEqual(mgr._periodic_scan.call_count, 3)
+
+        # And so does a new log (character login, fleet join)
+        (Path(log_dir) / "Fleet_20251201_095200.txt").write_text("header")
+        mgr._handle_debounced_directory_scan()
+        self.assertEqual(mgr._periodic_scan.call_count, 4)
+
 
 class TestDisconnectSessionSignals(unittest.TestCase):
     """Tests for _disconnect_session_signals helper."""
@@ -285,7 +363,9 @@ class TestLogProcessingWorker(unittest.TestCase):
             mock_provider.name = "DeepL"
             MockDeepL.return_value = mock_provider
             worker.update_config({'deepl_api_key': 'test-key', 'ignored_languages': ['en']})
+            QThreadPool.globalInstance().waitForDone()
             MockDeepL.assert_called_once_with('test-key')
+            self.assertIs(worker.translator_service.provider, mock_provider)
 
     def test_update_config_recreates_deepl_when_key_changes(self):
         """Changing the DeepL key should recreate the provider."""
@@ -299,6 +379,7 @@ class TestLogProcessingWorker(unittest.TestCase):
 
             worker.update_config({'deepl_api_key': 'first-key', 'ignored_languages': ['en']})
             worker.update_config({'deepl_api_key': 'second-key', 'ignored_languages': ['en']})
+            QThreadPool.globalInstance().waitForDone()
 
             self.assertEqual(MockDeepL.call_count, 2)
             MockDeepL.assert_any_call('first-key')
@@ -320,6 +401,7 @@ class TestLogProcessingWorker(unittest.TestCase):
 
             worker.update_config({'deepl_api_key': 'test-key', 'ignored_languages': ['en']})
             worker.update_config({'deepl_api_key': '', 'ignored_languages': ['en']})
+            QThreadPool.globalInstance().waitForDone()
 
             MockGoogle.assert_called_once_with()
             self.assertEqual(worker.translator_service.provider.name, "Google")
@@ -329,8 +411,32 @@ class TestLogProcessingWorker(unittest.TestCase):
         from src.services.translator import GoogleTransProvider
         worker = self._make_worker(GoogleTransProvider())
         worker.update_config({'deepl_api_key': '', 'ignored_languages': ['en']})
+        QThreadPool.globalInstance().waitForDone()
         self.assertEqual(worker.translator_service.provider.name, "Google")
 
+    def test_update_config_keeps_serving_until_provider_is_built(self):
+        """The old provider stays active while a new one is built; the latest key wins."""
+        from src.services.translator import GoogleTransProvider
+        google = GoogleTransProvider()
+        worker = self._make_worker(google)
+        service = worker.translator_service
+
+        with patch('src.services.translator.QThreadPool') as MockPool, \
+             patch('src.services.translator.DeepLProvider') as MockDeepL:
+            MockDeepL.side_effect = lambda key: MagicMock(key=key)
+            worker.update_config({'deepl_api_key': 'first-key', 'ignored_languages': ['en']})
+            worker.update_config({'deepl_api_key': 'second-key', 'ignored_languages': ['en']})
+            # Same key again must not queue another build
+            worker.update_config({'deepl_api_key': 'second-key', 'ignored_languages': ['en']})
+
+            first_build, second_build = [c.args[0] for c in MockPool.globalInstance().start.call_args_list]
+            self.assertIs(service.provider, google)
+
+            second_build()
+            self.assertEqual(service.provider.key, 'second-key')
+            first_build()  # A slower, superseded build must not win
+            self.assertEqual(service.provider.key, 'second-key')
+
     def test_process_lines_handles_errors(self):
         """Errors processing individual lines should not crash the batch."""
         from src.main import LogProcessingWorker
@@ -368,6 +474,75 @@ class TestLogProcessingWorker(unittest.TestCase):
         # Tokenizer should never be called since parse returned None
         tokenizer.tokenize.assert_not_called()
 
+    def test_process_lines_batches_translations_per_source_language(self):
+        """A burst of lines should cost one translation call per detected language."""
+        from src.main import LogProcessingWorker
+
+        parser = MagicMock()
+        parser.parse.side_effect = lambda line, _: MagicMock(
+            message=line, sender="Pilot",
+            timestamp=MagicMock(strftime=MagicMock(return_value="08:00:00"))
+        )
+        tokenizer = MagicMock()
+        tokenizer.tokenize.side_effect = lambda text: MagicMock(cleaned=text, tokens={})
+        langs = {"你好": (True, 'zh'), "hi": (False, 'en'), "再见": (True, 'zh'), "привет": (True, 'ru')}
+        detector = MagicMock()
+        detector.should_translate.side_effect = lambda text, ignored_langs: langs[text]
+        translator_service = MagicMock()
+        translator_service.translate_batch.side_effect = lambda texts, target, source_lang: [
+            (f"{source_lang}:{text}", True, "Mock") for text in texts
+        ]
+
+        worker = LogProcessingWorker(parser, tokenizer, detector, translator_service)
+        batches = []
+        worker.signals.messages_ready.connect(lambda sid, messages: batches.append((sid, messages)))
+        worker.process_lines("fleet", ["你好", "hi", "再见", "привет"])
+
+        self.assertEqual(translator_service.translate_batch.call_count, 2)
+        translator_service.translate_batch.assert_any_call(["你好", "再见"], 'en', source_lang='zh')
+        translator_service.translate_message.assert_not_called()
+        # The whole burst is delivered in one emission, in line order
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0][0], "fleet")
+        self.assertEqual([m[0] for m in batches[0][1]], ["zh:你好", "hi", "zh:再见", "ru:привет"])
+        self.assertEqual(batches[0][1][1], ("hi", "Pilot", "08:00:00", "", False))
+
+
+    def test_repeated_lines_reuse_detection_result(self):
+        """Identical cleaned text is language-detected once, via the detector's LRU."""
+        from src.main import LogProcessingWorker
+        from src.core.detector import LanguageDetector
+        from src.core.tokenizer import EVELinkTokenizer
+
+        parser = MagicMock()
+        parser.parse.return_value = MagicMock(
+            message="Bonjour tout le monde", sender="Pilot",
+            timestamp=MagicMock(strftime=MagicMock(return_value="08:00:00"))
+        )
+        detector = LanguageDetector()
+        detector._cld3 = None
+
+        worker = LogProcessingWorker(parser, EVELinkTokenizer(), detector, MagicMock())
+        worker.update_config({'ignored_languages': ['en', 'fr'], 'target_language': 'en'})
+        with patch('src.core.detector.detect', return_value='fr') as mock_detect:
+            worker.process_lines("fleet", ["line", "line"])
+            worker.process_lines("local", ["line"])
+        self.assertEqual(mock_detect.call_count, 1)
+
+    def test_restore_with_highlight_escapes_text_and_swaps_links(self):
+        from src.main import LogProcessingWorker
+        from src.core.tokenizer import EVELinkTokenizer
+
+        tokenized = EVELinkTokenizer().tokenize("a<b \x1aX\x1a ok \x03 __EVELINK_9__")
+        worker = LogProcessingWorker(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+
+        restored = worker._restore_with_highlight(tokenized.cleaned, tokenized.tokens_html)
+        self.assertEqual(
+            restored,
+            "a&lt;b <span style='color: yellow;'>\x1aX\x1a</span> ok "
+            "<span style='color: yellow;'>\x03</span> __EVELINK_9__"
+        )
+
 
 class TestHandleSessionConfigChange(unittest.TestCase):
     """Tests for _handle_session_config_change."""
@@ -410,5 +585,81 @@ class TestHandleSessionConfigChange(unittest.TestCase):
             mgr.worker.update_config.assert_called_once()
 
 
+
+class TestApplyConfigUpdate(unittest.TestCase):
+    """Tests for _apply_config_update."""
+
+    def _make_manager(self):
+        from src.app_config import get_default_config
+        with patch('src.main.TranslatorManager.__init__', lambda self: None):
+            from src.main import TranslatorManager
+            mgr = TranslatorManager()
+        mgr.config = get_default_config()
+        mgr.sessions = {'fleet': MagicMock(), 'local': None}
+        mgr._last_applied_session_cfg = {}
+        return mgr
+
+    def test_unchanged_or_worker_only_changes_skip_sessions(self):
+        mgr = self._make_manager()
+        session = mgr.sessions['fleet']
+
+        mgr._apply_config_update()
+        session.update_config.assert_called_once_with(mgr._build_session_config('fleet'))
+
+        mgr._apply_config_update()
+        mgr.config['shared']['target_language'] = 'de'
+        mgr.config['shared']['ignored_languages'] = ['en', 'ru']
+        mgr._apply_config_update()
+        session.update_config.assert_called_once()
+
+        mgr.config['shared']['opacity'] = 0.4
+        mgr._apply_config_update()
+        self.assertEqual(session.update_config.call_count, 2)
+        self.assertEqual(session.update_config.call_args.args[0]['opacity'], 0.4)
+
+    def test_overlay_side_changes_force_next_update(self):
+        mgr = self._make_manager()
+        mgr.worker = MagicMock()
+        mgr._apply_scanner_config = MagicMock()
+        mgr._save_config = MagicMock()
+        session = mgr.sessions['fleet']
+        mgr._apply_config_update()
+
+        # The overlay changes opacity itself, then a preview sets it back
+        mgr._handle_session_config_change('fleet', {'opacity': 0.5})
+        mgr.config['shared']['opacity'] = 0.8
+        mgr._apply_config_update()
+
+        self.assertEqual(session.update_config.call_count, 2)
+
+
+class TestOpenSettingsDialog(unittest.TestCase):
+    """Tests for open_settings_dialog."""
+
+    def test_cancel_restores_config_untouched_by_previews(self):
+        from src.app_config import get_default_config
+        with patch('src.main.TranslatorManager.__init__', lambda self: None):
+            from src.main import TranslatorManager
+            mgr = TranslatorManager()
+        mgr.config = get_default_config()
+        mgr.worker = MagicMock()
+        mgr.sessions = {}
+        mgr._apply_scanner_config = MagicMock()
+
+        def preview_then_cancel(config, parent=None):
+            # Live previews mutate the manager's config in place
+            config['shared']['ignored_languages'].append('de')
+            config['sessions']['fleet']['x'] = 999
+            dialog = MagicMock()
+            dialog.exec.return_value = 0
+            return dialog
+
+        with patch('src.main.SettingsDialog', side_effect=preview_then_cancel):
+            mgr.open_settings_dialog()
+
+        self.assertEqual(mgr.config, get_default_config())
+        mgr.worker.update_config.assert_called_once_with(mgr.config['shared'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -147,21 +147,220 @@ class TestOverlayNonUILogic(unittest.TestCase):
         self.assertIn("Move to", rendered_html)
         self.assertIn("#123456", rendered_html)
 
+    def test_show_only_rebuilds_after_hidden_changes(self):
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        overlay.hide()
+
+        with patch.object(overlay, "refresh_ui", wraps=overlay.refresh_ui) as refresh_spy:
+            overlay.show()
+            QApplication.processEvents()
+            self.assertEqual(refresh_spy.call_count, 0)
+
+            overlay.hide()
+            overlay.add_message("While hidden", "Player", "08:00:00", "", False)
+            overlay.show()
+            QApplication.processEvents()
+            self.assertEqual(refresh_spy.call_count, 1)
+
+        self.assertIn("While hidden", overlay.text_browser.toPlainText())
+
+    def test_refresh_reuses_cached_message_html(self):
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        overlay.clear_messages()
+        for i in range(3):
+            overlay.add_message(f"Msg {i}", "Player", "08:00:00", "", False)
+        self._wait_for_overlay_flush()
+
+        with patch.object(overlay, "_format_message_html", wraps=overlay._format_message_html) as fmt_spy:
+            overlay.refresh_ui()
+            self.assertEqual(fmt_spy.call_count, 0)
+
+            overlay.preview_settings({'color_default': '#abcdef'})
+            self.assertEqual(fmt_spy.call_count, 3)
+
+        self.assertIn("#abcdef", overlay.text_browser.toHtml())
+
+    def test_preview_window_only_settings_skip_rebuild(self):
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+
+        with patch.object(overlay, "refresh_ui", wraps=overlay.refresh_ui) as refresh_spy:
+            overlay.preview_settings({'opacity': 0.5, 'background_color': '#101010'})
+            self.assertEqual(refresh_spy.call_count, 0)
+            self.assertAlmostEqual(overlay.windowOpacity(), 0.5, places=2)
+            self.assertIn('#101010', overlay.text_browser.styleSheet())
+
+            overlay.preview_settings({'font_size': 14})
+            self.assertEqual(refresh_spy.call_count, 1)
+
     def test_batched_message_flush_scrolls_once(self):
         overlay = self._make_overlay()
         overlay.show()
         QApplication.processEvents()
         overlay.clear_messages()
 
-        original_move_cursor = overlay.text_browser.moveCursor
-        overlay.text_browser.moveCursor = MagicMock(side_effect=original_move_cursor)
+        scroll_bar = overlay.text_browser.verticalScrollBar()
+        with patch.object(scroll_bar, "setValue", wraps=scroll_bar.setValue) as scroll_spy:
+            for i in range(10):
+                overlay.add_message(f"Msg {i}", "Player", "08:00:00", "", False)
+
+            self._wait_for_overlay_flush()
+
+        self.assertEqual(scroll_spy.call_count, 1)
+
+    def test_flush_does_not_scroll_when_user_scrolled_up(self):
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        overlay.clear_messages()
+        for i in range(60):
+            overlay.add_message(f"Msg {i}", "Player", "08:00:00", "", False)
+        self._wait_for_overlay_flush()
+
+        scroll_bar = overlay.text_browser.verticalScrollBar()
+        self.assertGreater(scroll_bar.maximum(), 0)
+        self.assertEqual(scroll_bar.value(), scroll_bar.maximum())
+
+        scroll_bar.setValue(0)
+        overlay.add_message("New", "Player", "08:00:01", "", False)
+        self._wait_for_overlay_flush()
+        self.assertEqual(scroll_bar.value(), 0)
+
+    def test_batched_message_flush_keeps_one_block_per_message(self):
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        overlay.clear_messages()
 
-        for i in range(10):
+        for i in range(5):
             overlay.add_message(f"Msg {i}", "Player", "08:00:00", "", False)
 
         self._wait_for_overlay_flush()
 
-        self.assertEqual(overlay.text_browser.moveCursor.call_count, 1)
+        lines = [
+            line for line in overlay.text_browser.toPlainText().splitlines()
+            if line.strip()
+        ]
+        self.assertEqual([line.split()[-1] for line in lines], [str(i) for i in range(5)])
+
+    def test_interior_rect_matches_check_edge(self):
+        from PySide6.QtCore import QPoint
+
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        rect = overlay.rect()
+
+        for x in range(-1, rect.width() + 2):
+            for y in (-1, 0, 9, 10, 11, rect.height() // 2, rect.height() - 10, rect.height() - 9, rect.height()):
+                pos = QPoint(x, y)
+                self.assertEqual(
+                    overlay._interior_rect.contains(pos), overlay.check_edge(pos) is None, (x, y)
+                )
+
+    def test_check_edge_corners_and_sides(self):
+        from PySide6.QtCore import QPoint, Qt
+
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        w, h = overlay.width(), overlay.height()
+
+        self.assertEqual(overlay.check_edge(QPoint(2, 2)), Qt.Edge.TopEdge | Qt.Edge.LeftEdge)
+        self.assertEqual(overlay.check_edge(QPoint(w - 2, h - 2)), Qt.Edge.BottomEdge | Qt.Edge.RightEdge)
+        self.assertEqual(overlay.check_edge(QPoint(w - 2, 2)), Qt.Edge.TopEdge | Qt.Edge.RightEdge)
+        self.assertEqual(overlay.check_edge(QPoint(2, h - 2)), Qt.Edge.BottomEdge | Qt.Edge.LeftEdge)
+        self.assertEqual(overlay.check_edge(QPoint(w // 2, 2)), Qt.Edge.TopEdge)
+        self.assertEqual(overlay.check_edge(QPoint(w - 2, h // 2)), Qt.Edge.RightEdge)
+        self.assertIsNone(overlay.check_edge(QPoint(w // 2, h // 2)))
+
+    def test_edge_cursor_is_set_once_per_edge(self):
+        from PySide6.QtCore import QEvent, QPointF, Qt
+        from PySide6.QtGui import QMouseEvent
+
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+
+        def move_to(x, y):
+            pos = QPointF(x, y)
+            event = QMouseEvent(
+                QEvent.Type.MouseMove, pos, pos, pos,
+                Qt.MouseButton.NoButton, Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+            )
+            return overlay.eventFilter(overlay.text_browser.viewport(), event)
+
+        with patch.object(overlay, "setCursor", wraps=overlay.setCursor) as set_spy, \
+                patch.object(overlay, "unsetCursor", wraps=overlay.unsetCursor) as unset_spy:
+            self.assertTrue(move_to(2, 50))
+            self.assertTrue(move_to(2, 60))
+            self.assertEqual(overlay.cursor().shape(), Qt.CursorShape.SizeHorCursor)
+            self.assertTrue(move_to(2, 2))
+            move_to(150, 100)
+            move_to(160, 100)
+
+        self.assertEqual(set_spy.call_count, 2)
+        self.assertEqual(unset_spy.call_count, 1)
+
+    def test_viewport_positions_are_mapped_to_window(self):
+        from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+        from PySide6.QtGui import QMouseEvent
+
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        viewport = overlay.text_browser.viewport()
+        offset = viewport.mapTo(overlay, QPoint(0, 0))
+
+        # Just inside the margin in window coordinates, expressed relative to the viewport
+        pos = QPointF(overlay.resize_margin - offset.x(), 100)
+        event = QMouseEvent(
+            QEvent.Type.MouseMove, pos, pos, pos,
+            Qt.MouseButton.NoButton, Qt.MouseButton.NoButton, Qt.KeyboardModifier.NoModifier,
+        )
+        self.assertEqual(overlay._window_pos(viewport, event), QPoint(overlay.resize_margin, 100 + offset.y()))
+        self.assertIsNone(overlay.check_edge(overlay._window_pos(viewport, event)))
+
+    def test_right_drag_moves_are_coalesced(self):
+        from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+        from PySide6.QtGui import QMouseEvent
+
+        overlay = self._make_overlay()
+        overlay.show()
+        QApplication.processEvents()
+        start = overlay.pos()
+
+        def mouse(kind, x, button, buttons):
+            pos = QPointF(150, 100)
+            return QMouseEvent(kind, pos, pos, QPointF(x, 0), button, buttons, Qt.KeyboardModifier.NoModifier)
+
+        viewport = overlay.text_browser.viewport()
+        right = Qt.MouseButton.RightButton
+        overlay.eventFilter(viewport, mouse(QEvent.Type.MouseButtonPress, 0, right, right))
+        with patch.object(overlay, "move", wraps=overlay.move) as move_spy:
+            for x in (10, 20, 30):
+                overlay.eventFilter(viewport, mouse(QEvent.Type.MouseMove, x, Qt.MouseButton.NoButton, right))
+            self.assertEqual(move_spy.call_count, 0)
+
+            with patch.object(overlay, "save_config"):
+                overlay.eventFilter(viewport, mouse(QEvent.Type.MouseButtonRelease, 30, right, Qt.MouseButton.NoButton))
+            move_spy.assert_called_once_with(start + QPoint(30, 0))
+
+    def test_export_line_strips_html(self):
+        overlay = self._make_overlay()
+        msg = {
+            'text': "Go <span style='color: yellow;'>Jita</span> &amp; dock",
+            'sender': 'FC',
+            'timestamp': '08:00:00',
+            'original_text': '<b>去</b>吉他',
+            'is_translated': True,
+        }
+        self.assertEqual(overlay._export_line(msg), "[08:00:00] FC > Go Jita & dock (去吉他)\n")
 
     def test_export_includes_bounded_current_history(self):
         overlay = self._make_overlay()
@@ -220,6 +419,14 @@ class TestOverlayNonUILogic(unittest.TestCase):
         self.assertEqual(len(overlay.available_characters), 1)
         self.assertIn('123', overlay.available_characters)
 
+    def test_update_character_list_sorts_by_name(self):
+        overlay = self._make_overlay('local')
+        overlay.update_character_list({
+            '1': CharacterInfo('1', 'Zed', '/a', 1000, None, True),
+            '2': CharacterInfo('2', 'Alice', '/b', 1000, None, True),
+        })
+        self.assertEqual([c.character_name for c in overlay._sorted_characters], ['Alice', 'Zed'])
+
     # --- update_fleet_list ---
 
     def test_update_fleet_list(self):
@@ -231,6 +438,14 @@ class TestOverlayNonUILogic(unittest.TestCase):
         overlay.update_fleet_list(fleets, 'f1')
         self.assertEqual(len(overlay.available_fleets), 2)
         self.assertEqual(overlay.selected_fleet_id, 'f1')
+        # Newest first, labels formatted once per update
+        self.assertEqual([fid for fid, _ in overlay._fleet_menu_entries], ['f2', 'f1'])
+        self.assertTrue(overlay._fleet_menu_entries[0][1].startswith("Fleet - Pilot2 ["))
+
+    def test_fleet_menu_label_marks_inactive(self):
+        overlay = self._make_overlay('fleet')
+        overlay.update_fleet_list({'f1': FleetInfo('f1', 'Pilot1', '/p', 1000, 100.0, False)}, None)
+        self.assertTrue(overlay._fleet_menu_entries[0][1].endswith("] [Inactive]"))
 
     # --- _format_message_html ---
 
@@ -1,8 +1,11 @@
 import pytest
-from unittest.mock import patch
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from src.core.detector import LanguageDetector
-from src.services.translator import TranslationService, MockTranslator
+from src.core.detector import LanguageDetector, detect, SCRIPT_HAN, SCRIPT_KANA, SCRIPT_HANGUL
+from src.services.translator import TranslationService, MockTranslator, MAX_CONCURRENT_TRANSLATIONS
 
 
 class CountingProvider:
@@ -18,12 +21,75 @@ class CountingProvider:
             return self.responses.pop(0)
         return f"{target_lang}:{source_lang}:{text}"
 
+
+class BatchCountingProvider(CountingProvider):
+    def __init__(self, responses=()):
+        super().__init__(responses)
+        self.batches = []
+
+    def translate_batch(self, texts, target_lang='en', source_lang=None):
+        self.batches.append(list(texts))
+        return [self.translate(text, target_lang, source_lang) for text in texts]
+
 def test_detector_cjk():
     detector = LanguageDetector()
     assert detector.is_cjk("你好") is True
     assert detector.is_cjk("Hello") is False
     assert detector.should_translate("你好", ignored_langs={'en'})[0] is True
 
+def test_detector_script_flags():
+    detector = LanguageDetector()
+    assert detector.script_flags("Hello") == 0
+    assert detector.script_flags("Привет, красные в локале") == 0
+    assert detector.script_flags("你好") == SCRIPT_HAN
+    assert detector.script_flags("カタカナ and 漢字") == SCRIPT_KANA | SCRIPT_HAN
+    assert detector.script_flags("안녕 你好 ひらがな") == SCRIPT_HAN | SCRIPT_KANA | SCRIPT_HANGUL
+    # Hangul alone is not treated as CJK by is_cjk
+    assert detector.is_cjk("안녕하세요") is False
+
+def test_detect_returns_none_without_features():
+    assert detect("12345 !!!") is None
+    assert detect("Bonjour tout le monde, comment allez-vous") == 'fr'
+
+def test_detector_statistical_fallback_scores_every_language():
+    # Languages DeepL cannot take as a source must still be identified, not
+    # closest-matched to one it can (which would then be sent as source_lang).
+    detector = LanguageDetector()
+    detector._cld3 = None
+    assert detector.detect_language("Xin chào tất cả mọi người, hôm nay bạn có khỏe không?") == 'vi'
+
+def test_detector_batch_detects_each_distinct_text_once():
+    with patch('src.core.detector.detect', return_value='fr') as mock_detect:
+        detector = LanguageDetector()
+        detector._cld3 = None
+        texts = ["Bonjour a tous", "12:30", "Bonjour a tous", "你好"]
+        assert detector.detect_languages_batch(texts) == ['fr', 'en', 'fr', 'zh']
+        assert detector.detect_languages_batch([]) == []
+    assert mock_detect.call_count == 2
+
+def test_detector_letterless_ascii_skips_langdetect():
+    with patch('src.core.detector.detect') as mock_detect:
+        detector = LanguageDetector()
+        assert detector.detect_language("12:30 !!") == 'en'
+        assert detector.detect_language("1234 5678") == 'en'
+    mock_detect.assert_not_called()
+
+def test_detector_prefers_reliable_cld3_result():
+    identifier = MagicMock()
+    fake_gcld3 = SimpleNamespace(NNetLanguageIdentifier=MagicMock(return_value=identifier))
+    with patch('src.core.detector.gcld3', fake_gcld3), \
+            patch('src.core.detector.detect', return_value='fr') as mock_detect:
+        detector = LanguageDetector()
+
+        identifier.FindLanguage.return_value = SimpleNamespace(language='iw', is_reliable=True)
+        assert detector.detect_language("shalom shalom") == 'he'
+        mock_detect.assert_not_called()
+
+        # Unreliable cld3 results fall back to langdetect
+        identifier.FindLanguage.return_value = SimpleNamespace(language='de', is_reliable=False)
+        assert detector.detect_language("bonjour bonjour") == 'fr'
+        mock_detect.assert_called_once()
+
 def test_detector_langdetect():
     detector = LanguageDetector()
     # "Bonjour" is French
@@ -72,6 +138,105 @@ def test_translation_failures_are_not_cached():
     assert provider.calls == 2
 
 
+def test_translate_batch_uses_one_provider_call_for_misses():
+    provider = BatchCountingProvider()
+    service = TranslationService(provider=provider)
+    service.translate_message("cached", "en", source_lang="fr")
+
+    results = service.translate_batch(["un", "cached", "deux", "un", "  "], "en", source_lang="fr")
+
+    assert results == [
+        ("en:fr:un", True, "Counting"),
+        ("en:fr:cached", True, "Counting"),
+        ("en:fr:deux", True, "Counting"),
+        ("en:fr:un", True, "Counting"),
+        ("  ", True, "Counting"),
+    ]
+    # Cache hits, in-batch duplicates and blank lines never reach the provider
+    assert provider.batches == [["un", "deux"]]
+
+
+def test_translate_batch_failures_return_original_and_are_not_cached():
+    provider = BatchCountingProvider([None, "two"])
+    service = TranslationService(provider=provider)
+
+    results = service.translate_batch(["one", "deux"], "en", source_lang="fr")
+
+    assert results == [("one", False, "Counting"), ("two", True, "Counting")]
+    assert service.translate_message("one", "en", source_lang="fr") == ("en:fr:one", True, "Counting")
+
+
+def test_deepl_translate_batch_sends_one_request():
+    from src.services.translator import DeepLProvider
+
+    provider = DeepLProvider.__new__(DeepLProvider)
+    provider.translator = MagicMock()
+    provider.translator.translate_text.return_value = [
+        SimpleNamespace(text="hello"), SimpleNamespace(text="bye")
+    ]
+
+    assert provider.translate_batch(["你好", "再见"], "en", "zh-cn") == ["hello", "bye"]
+    provider.translator.translate_text.assert_called_once_with(
+        ["你好", "再见"], target_lang="EN-US", source_lang="ZH"
+    )
+
+    provider.translator.translate_text.side_effect = Exception("quota")
+    assert provider.translate_batch(["a", "b"], "en") == [None, None]
+
+
+def test_translation_service_limits_concurrent_provider_calls():
+    class SlowProvider(CountingProvider):
+        name = "Google"
+
+        def __init__(self):
+            super().__init__([])
+            self.lock = threading.Lock()
+            self.active = 0
+            self.peak = 0
+
+        def translate(self, text, target_lang='en', source_lang=None):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05)
+            with self.lock:
+                self.active -= 1
+            return text.upper()
+
+    provider = SlowProvider()
+    service = TranslationService(provider=provider)
+    threads = [
+        threading.Thread(target=service.translate_message, args=(f"text {i}", 'en', 'fr'))
+        for i in range(MAX_CONCURRENT_TRANSLATIONS['google'] * 2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.peak == MAX_CONCURRENT_TRANSLATIONS['google']
+    assert service.translate_message("text 0", 'en', 'fr') == ("TEXT 0", True, "Google")
+
+
+def test_translation_cache_access_waits_for_provider_swap_lock():
+    # A background provider swap clears the cache while holding _provider_lock;
+    # the worker thread's cache reads and writes must wait for it.
+    service = TranslationService(provider=MockTranslator())
+    key = ("mock", "en", "fr", "bonjour")
+
+    with service._provider_lock:
+        writer = threading.Thread(target=service._store_cached_translation, args=(key, "hello"))
+        writer.start()
+        writer.join(0.05)
+        assert writer.is_alive()
+        assert service._translation_cache == {}
+    writer.join()
+
+    assert service._get_cached_translation(key) == "hello"
+    service._build_provider(('google', ""), service._provider_generation)
+    assert service._translation_cache == {}
+
+
 def test_translation_cache_clears_when_target_language_changes():
     service = TranslationService()
     service._store_cached_translation(("google", "en", "fr", "bonjour"), "hello")
@@ -195,6 +195,27 @@ class TestSessionConfigUpdate(unittest.TestCase):
             "Hello", "Player", "08:00:00", "", False
         )
 
+    @patch(PATCH_OVERLAY)
+    @patch(PATCH_TAILER)
+    def test_add_messages_forwards_batch_in_order(self, MockTailer, MockOW):
+        """add_messages should forward every message of a batch to overlay."""
+        from src.core.session import ChatSession
+        from unittest.mock import call
+        config = _make_config()
+
+        mock_ow = MagicMock()
+        MockOW.return_value = mock_ow
+
+        session = ChatSession('fleet', self.log_path, config)
+        session.add_messages([
+            ("Hello", "Player", "08:00:00", "", False),
+            ("Hi", "Pilot", "08:00:01", "你好", True),
+        ])
+        self.assertEqual(mock_ow.add_message.call_args_list, [
+            call("Hello", "Player", "08:00:00", "", False),
+            call("Hi", "Pilot", "08:00:01", "你好", True),
+        ])
+
     @patch(PATCH_OVERLAY)
     @patch(PATCH_TAILER)
     def test_get_config_returns_overlay_config(self, MockTailer, MockOW):
@@ -314,6 +335,23 @@ class TestSessionConfigUpdate(unittest.TestCase):
         session._start_log_watcher.assert_called_once()
         session._poll_log.assert_called_once()
 
+    @patch(PATCH_OVERLAY)
+    @patch(PATCH_TAILER)
+    def test_start_watches_log_and_stop_unwatches(self, MockTailer, MockOW):
+        """Reads are driven by the file watcher; the poll timer is only a slow fallback."""
+        from PySide6.QtWidgets import QApplication
+        from src.core.session import ChatSession
+
+        app = QApplication.instance() or QApplication(sys.argv)
+        session = ChatSession('fleet', self.log_path, _make_config())
+        session.start()
+
+        self.assertIn(str(Path(self.log_path)), session.file_watcher.files())
+        self.assertGreaterEqual(session.poll_timer.interval(), 5000)
+
+        session.stop()
+        self.assertEqual(session.file_watcher.files(), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,165 @@
+import sys
+import unittest
+from unittest.mock import patch
+
+from PySide6.QtGui import QColor
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QApplication, QPushButton
+
+from src.app_config import get_default_config
+
+
+class TestSettingsDialog(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        if not QApplication.instance():
+            cls.app = QApplication(sys.argv)
+
+    def _make_dialog(self, config=None):
+        from src.gui.settings import SettingsDialog
+        dialog = SettingsDialog(config or get_default_config())
+        self.addCleanup(dialog.close)
+        return dialog
+
+    def test_session_tabs_are_built_on_first_visit(self):
+        dialog = self._make_dialog()
+        self.assertFalse(hasattr(dialog, 'spin_fleet_threshold'))
+        self.assertIsNone(dialog.tab_fleet.layout())
+
+        dialog.tabs.setCurrentWidget(dialog.tab_fleet)
+        self.assertIsNotNone(dialog.tab_fleet.layout())
+        self.assertEqual(dialog.spin_fleet_threshold.value(), 30)
+
+        layout = dialog.tab_fleet.layout()
+        dialog.tabs.setCurrentWidget(dialog.tab_shared)
+        dialog.tabs.setCurrentWidget(dialog.tab_fleet)
+        self.assertIs(dialog.tab_fleet.layout(), layout)
+
+    def test_get_settings_keeps_unvisited_fleet_values(self):
+        config = get_default_config()
+        config['shared']['fleet_history_lines'] = 12
+        dialog = self._make_dialog(config)
+
+        settings = dialog.get_settings()
+        self.assertEqual(settings['shared']['fleet_history_lines'], 12)
+
+        dialog.tabs.setCurrentWidget(dialog.tab_fleet)
+        dialog.spin_fleet_history.setValue(3)
+        self.assertEqual(dialog.get_settings()['shared']['fleet_history_lines'], 3)
+
+    def test_widget_changes_emit_one_debounced_preview(self):
+        from src.gui.settings import SETTINGS_PREVIEW_DEBOUNCE_MS
+
+        dialog = self._make_dialog()
+        emitted = []
+        dialog.settings_changed.connect(emitted.append)
+
+        for value in range(30, 60, 5):
+            dialog.slider_opacity.setValue(value)
+        self.assertEqual(emitted, [])
+
+        QTest.qWait(SETTINGS_PREVIEW_DEBOUNCE_MS + 100)
+        self.assertEqual(len(emitted), 1)
+        self.assertAlmostEqual(emitted[0]['shared']['opacity'], 0.55)
+
+    def test_closing_dialog_drops_pending_preview(self):
+        from src.gui.settings import SETTINGS_PREVIEW_DEBOUNCE_MS
+
+        dialog = self._make_dialog()
+        emitted = []
+        dialog.settings_changed.connect(emitted.append)
+
+        dialog.spin_font.setValue(20)
+        dialog.reject()
+        QTest.qWait(SETTINGS_PREVIEW_DEBOUNCE_MS + 100)
+        self.assertEqual(emitted, [])
+
+    def test_picking_same_color_skips_restyle(self):
+        dialog = self._make_dialog()
+        button = dialog.btn_col_def
+        with patch.object(dialog, '_get_color', return_value=QColor('#e0e0e0')), \
+                patch.object(dialog, '_notify_change') as notify:
+            dialog._pick_color_shared(button, 'color_default')
+        notify.assert_not_called()
+
+        with patch.object(dialog, '_get_color', return_value=QColor('#123456')):
+            dialog._pick_color_shared(button, 'color_default')
+        self.assertEqual(dialog.config['shared']['color_default'], '#123456')
+        self.assertIn('#123456', button.styleSheet())
+
+    def test_dialog_edits_do_not_reach_original_config(self):
+        config = get_default_config()
+        dialog = self._make_dialog(config)
+
+        dialog.edit_ignored.setText("de, fr")
+        with patch.object(dialog, '_get_color', return_value=QColor('#123456')):
+            dialog._pick_color_session(QPushButton(), 'fleet', 'background_color')
+        settings = dialog.get_settings()
+
+        self.assertEqual(settings['shared']['ignored_languages'], ['de', 'fr'])
+        self.assertEqual(settings['sessions']['fleet']['background_color'], '#123456')
+        self.assertEqual(config['shared']['ignored_languages'], ['en'])
+        self.assertEqual(config['sessions']['fleet']['background_color'], '#33001a')
+
+    def test_ignored_languages_accept_commas_and_spaces(self):
+        dialog = self._make_dialog()
+        dialog.edit_ignored.setText(" en,,de  fr ,")
+        self.assertEqual(dialog.get_settings()['shared']['ignored_languages'], ['en', 'de', 'fr'])
+
+    def test_reset_position_reuses_feedback_label(self):
+        from PySide6.QtWidgets import QLabel
+
+        dialog = self._make_dialog()
+        dialog.tabs.setCurrentWidget(dialog.tab_local)
+        labels_before = len(dialog.tab_local.findChildren(QLabel))
+
+        for _ in range(3):
+            dialog._reset_position('local')
+
+        self.assertEqual(len(dialog.tab_local.findChildren(QLabel)), labels_before)
+        self.assertEqual(dialog._reset_labels['local'].text(), "Position reset pending save.")
+        self.assertEqual(dialog.config['sessions']['local']['x'], -1)
+
+    def test_color_dialog_is_created_once_and_reused(self):
+        from PySide6.QtWidgets import QColorDialog, QDialog
+
+        dialog = self._make_dialog()
+        with patch.object(QColorDialog, 'exec', return_value=QDialog.DialogCode.Rejected) as exec_spy:
+            self.assertFalse(dialog._get_color('#e0e0e0').isValid())
+            color_dialog = dialog._color_dialog
+            dialog._get_color('#00ffff')
+
+        self.assertIs(dialog._color_dialog, color_dialog)
+        self.assertEqual(color_dialog.currentColor().name(), '#00ffff')
+        self.assertEqual(exec_spy.call_count, 2)
+
+    def test_buttons_dispatch_to_bound_handlers(self):
+        dialog = self._make_dialog()
+        with patch.object(dialog, '_get_color', return_value=QColor('#abcdef')):
+            dialog.btn_col_trans.click()
+        self.assertEqual(dialog.config['shared']['color_translated'], '#abcdef')
+
+        dialog.tabs.setCurrentWidget(dialog.tab_fleet)
+        reset_button = next(
+            b for b in dialog.tab_fleet.findChildren(QPushButton)
+            if b.text() == "Reset Position to Default"
+        )
+        reset_button.click()
+        self.assertEqual(dialog.config['sessions']['fleet']['x'], -1)
+
+    def test_opening_dialog_and_tabs_emits_no_preview(self):
+        from src.gui.settings import SETTINGS_PREVIEW_DEBOUNCE_MS
+
+        dialog = self._make_dialog()
+        emitted = []
+        dialog.settings_changed.connect(emitted.append)
+
+        dialog.tabs.setCurrentWidget(dialog.tab_fleet)
+        dialog.tabs.setCurrentWidget(dialog.tab_local)
+        QTest.qWait(SETTINGS_PREVIEW_DEBOUNCE_MS + 100)
+
+        self.assertEqual(emitted, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,11 @@
 import os
+import sys
 import tempfile
 import shutil
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.core.tailer import FleetLogTailer
 
@@ -106,6 +108,15 @@ class TestFleetLogTailer(unittest.TestCase):
         lines = tailer.read_new_lines()
         self.assertEqual(lines, [])
 
+    def test_read_new_lines_picks_up_file_created_later(self):
+        path = os.path.join(self.test_dir, "late.txt")
+        tailer = FleetLogTailer(path)
+        self.assertEqual(tailer.read_new_lines(), [])
+
+        self._create_log("late.txt", lines=["[ 2025.12.16 08:26:00 ] Pilot > First"])
+        self.assertEqual(tailer.read_new_lines(), ["[ 2025.12.16 08:26:00 ] Pilot > First"])
+        tailer.close()
+
     def test_read_new_lines_strips_newlines(self):
         path = self._create_log()
         tailer = FleetLogTailer(path)
@@ -115,6 +126,56 @@ class TestFleetLogTailer(unittest.TestCase):
             self.assertFalse(line.endswith('\r'))
         tailer.close()
 
+    def test_read_new_lines_waits_for_whole_code_units(self):
+        """An odd trailing byte from a write in progress is read on the next poll."""
+        path = self._create_log()
+        tailer = FleetLogTailer(path)
+        tailer.seek_to_end()
+
+        data = "\r\n[ 2025.12.16 08:26:00 ] Pilot > \x1aA\x1c\x03 ok\r\n".encode('utf-16-le')
+        with open(path, 'ab') as f:
+            f.write(data[:-1])
+        lines = tailer.read_new_lines()
+        self.assertIn("[ 2025.12.16 08:26:00 ] Pilot > \x1aA\x1c\x03 ok", lines)
+        self.assertEqual(tailer.last_position, os.path.getsize(path) - 1)
+
+        with open(path, 'ab') as f:
+            f.write(data[-1:])
+        tailer.read_new_lines()
+        self.assertEqual(tailer.last_position, os.path.getsize(path))
+        tailer.close()
+
+    def test_read_new_lines_keeps_split_surrogate_pair(self):
+        """A character written in two halves is decoded once both halves arrive."""
+        path = self._create_log()
+        tailer = FleetLogTailer(path)
+        tailer.seek_to_end()
+
+        data = "\r\n[ 2025.12.16 08:26:00 ] Pilot > o7 \U0001F600".encode('utf-16-le')
+        with open(path, 'ab') as f:
+            f.write(data[:-2])
+        self.assertEqual(tailer.read_new_lines(), ["", "[ 2025.12.16 08:26:00 ] Pilot > o7 "])
+
+        with open(path, 'ab') as f:
+            f.write(data[-2:])
+        self.assertEqual(tailer.read_new_lines(), ["\U0001F600"])
+        tailer.close()
+
+    @unittest.skipIf(sys.platform == 'win32', "Open files cannot be replaced on Windows")
+    def test_read_new_lines_follows_replaced_file(self):
+        """A log replaced by a new file at the same path is re-read from the start."""
+        path = self._create_log()
+        tailer = FleetLogTailer(path)
+        tailer.seek_to_end()
+
+        # Larger than the original, so only the inode change reveals the swap
+        new_lines = [f"[ 2025.12.16 09:00:{i:02d} ] Pilot > New session {i}" for i in range(10)]
+        replacement = self._create_log("replacement.txt", lines=new_lines)
+        os.replace(replacement, path)
+
+        self.assertEqual(tailer.read_new_lines(), new_lines)
+        tailer.close()
+
     # --- close ---
 
     def test_close_sets_handle_none(self):
@@ -216,6 +277,17 @@ class TestFleetLogTailer(unittest.TestCase):
         self.assertEqual(tailer.read_last_n_lines(7), expected_messages[-7:])
         tailer.close()
 
+    def test_read_last_n_lines_across_small_chunks(self):
+        """Lines split across read blocks (incl. surrogate pairs) come back whole."""
+        messages = [f"[ 2025.12.16 10:00:{i:02d} ] Pilot > \u4f60\U0001F600 msg {i}" for i in range(12)]
+        path = self._create_log(lines=["Channel ID:      (None)", ""] + messages)
+        tailer = FleetLogTailer(path)
+
+        with patch('src.core.tailer.TAIL_CHUNK_SIZE', 10):
+            self.assertEqual(tailer.read_last_n_lines(4), messages[-4:])
+            self.assertEqual(tailer.read_last_n_lines(50), messages)
+        tailer.close()
+
     # --- Integration ---
 
     def test_full_tail_workflow(self):